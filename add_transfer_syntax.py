@@ -13,6 +13,12 @@ from pathlib import Path
 
 CONFIG_FILE = "dicom_config.json"
 
+# Menu choice -> transfer syntax name (anything else selects the default)
+SYNTAX_CHOICES = {
+    "1": "JPEG2000Lossless",
+    "2": "ExplicitVRLittleEndian",
+}
+
 def main():
     if not Path(CONFIG_FILE).exists():
         print(f"❌ Error: {CONFIG_FILE} not found!")
@@ -28,8 +34,10 @@ def main():
     with open(CONFIG_FILE, 'r') as f:
         config = json.load(f)
 
+    # Stream the pretty-printed config instead of building the full string first
     print("Current configuration:")
-    print(json.dumps(config, indent=2))
+    json.dump(config, sys.stdout, indent=2)
+    print()
     print("\n" + "=" * 80)
 
     # Check if already has new format
@@ -37,42 +45,62 @@ def main():
         print("\n✓ Configuration already uses 'remotes' format")
 
         # Check if transfer_syntax is missing
-        needs_update = False
-        for short_name, node in config["remotes"].items():
-            if "transfer_syntax" not in node:
-                needs_update = True
-                print(f"\n⚠ Node '{short_name}' is missing transfer_syntax")
+        missing = [short_name for short_name, node in config["remotes"].items()
+                   if "transfer_syntax" not in node]
+        for short_name in missing:
+            print(f"\n⚠ Node '{short_name}' is missing transfer_syntax")
 
-        if needs_update:
+        if missing:
             print("\nAdding transfer_syntax to nodes...\n")
 
-            for short_name, node in config["remotes"].items():
-                if "transfer_syntax" not in node:
+            if sys.stdin.isatty():
+                # Interactive: ask for each node separately
+                for short_name in missing:
+                    node = config["remotes"][short_name]
                     print(f"Node: {short_name} ({node['name']})")
                     print("  1) JPEG2000Lossless (default)")
                     print("  2) ExplicitVRLittleEndian")
-
                     choice = input(f"  Choose transfer syntax for '{short_name}' (1 or 2): ").strip()
-
-                    if choice == "2":
-                        node["transfer_syntax"] = "ExplicitVRLittleEndian"
-                        print(f"  ✓ Set to ExplicitVRLittleEndian\n")
-                    else:
-                        node["transfer_syntax"] = "JPEG2000Lossless"
-                        print(f"  ✓ Set to JPEG2000Lossless (default)\n")
+                    transfer_syntax = SYNTAX_CHOICES.get(choice, "JPEG2000Lossless")
+                    node["transfer_syntax"] = transfer_syntax
+                    suffix = " (default)" if transfer_syntax == "JPEG2000Lossless" else ""
+                    print(f"  ✓ Set to {transfer_syntax}{suffix}\n")
+            else:
+                # Piped input: read all answers at once, one per node
+                print("  1) JPEG2000Lossless (default)")
+                print("  2) ExplicitVRLittleEndian")
+                for i, short_name in enumerate(missing, 1):
+                    print(f"  [{i}] {short_name} ({config['remotes'][short_name]['name']})")
+                lines = sys.stdin.read().splitlines()
+                if len(lines) == 1:
+                    # Single line: whitespace separated answers ("1 2 1")
+                    choices = lines[0].split()
+                else:
+                    # One answer per line; an empty line keeps the default for that node
+                    choices = [line.strip() for line in lines]
+
+                for i, short_name in enumerate(missing):
+                    choice = choices[i] if i < len(choices) else ""
+                    transfer_syntax = SYNTAX_CHOICES.get(choice, "JPEG2000Lossless")
+                    config["remotes"][short_name]["transfer_syntax"] = transfer_syntax
+                    print(f"  ✓ {short_name}: {transfer_syntax}")
+                print()
 
             # Add transfer_syntax to local node if missing
             if "transfer_syntax" not in config["local"]:
                 config["local"]["transfer_syntax"] = "JPEG2000Lossless"
 
+            # Serialize once and reuse the same text for disk and display
+            config_text = json.dumps(config, indent=2)
+
             # Save updated config
             with open(CONFIG_FILE, 'w') as f:
-                json.dump(config, f, indent=2)
+                f.write(config_text)
 
             print("=" * 80)
             print("\n✓ Configuration updated successfully!")
             print("\nUpdated configuration:")
-            print(json.dumps(config, indent=2))
+            print(config_text)
 
         else:
             print("\n✓ All nodes already have transfer_syntax configured!")
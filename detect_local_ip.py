@@ -1,13 +1,25 @@
 #!/usr/bin/env python3
 """
 Detect local IP address helper
+
+Set DICOM_MOVER_LOCAL_IP to a fixed IPv4 address to skip detection entirely.
 """
 
+import os
 import socket
-import subprocess
-import re
+import struct
 from typing import Optional
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+LOCAL_IP_ENV_VAR = "DICOM_MOVER_LOCAL_IP"
+SIOCGIFADDR = 0x8915
+PROC_NET_ROUTE = "/proc/net/route"
+RTF_UP_GATEWAY = 0x0003  # RTF_UP | RTF_GATEWAY
+
 
 def get_local_ip_socket() -> Optional[str]:
     """
@@ -27,31 +39,86 @@ def get_local_ip_socket() -> Optional[str]:
         return None
 
 
-def get_local_ip_ifconfig() -> Optional[str]:
+def _ipv4_for_interface(sock: socket.socket, name: str) -> Optional[str]:
     """
-    Get local IP using ifconfig command (macOS/Linux).
-    Looks for 192.168.x.x addresses.
+    Get the IPv4 address of a network interface via the SIOCGIFADDR ioctl (Linux).
     """
+    if fcntl is None:
+        return None
     try:
-        result = subprocess.run(['ifconfig'], capture_output=True, text=True, timeout=2)
-        output = result.stdout
+        result = fcntl.ioctl(sock.fileno(), SIOCGIFADDR, struct.pack('256s', name[:15].encode()))
+        return socket.inet_ntoa(result[20:24])
+    except OSError:
+        return None
 
-        # Find all inet addresses
-        pattern = r'inet (\d+\.\d+\.\d+\.\d+)'
-        matches = re.findall(pattern, output)
 
-        # Filter for local network addresses (192.168.x.x)
-        for ip in matches:
-            if ip.startswith('192.168.') and ip != '192.168.1.1':
-                return ip
+def get_local_ip_procroute() -> Optional[str]:
+    """
+    Get local IP of the default-route interface from /proc/net/route (Linux).
+    Needs no network traffic, so it also works when 8.8.8.8 is unreachable.
+    """
+    if fcntl is None:
+        return None
+    try:
+        with open(PROC_NET_ROUTE, 'r') as f:
+            next(f, None)  # Skip header
+            for line in f:
+                fields = line.split()
+                if len(fields) < 4 or fields[1] != '00000000':
+                    continue
+                if int(fields[3], 16) & RTF_UP_GATEWAY != RTF_UP_GATEWAY:
+                    continue
+                s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                try:
+                    return _ipv4_for_interface(s, fields[0])
+                finally:
+                    s.close()
+    except (OSError, ValueError):
+        pass
+
+    return None
 
-        # If no 192.168.x.x found, return first non-localhost
-        for ip in matches:
-            if not ip.startswith('127.'):
-                return ip
 
-    except Exception:
-        pass
+def get_local_ip_interfaces() -> Optional[str]:
+    """
+    Get local IP by enumerating network interfaces in-process.
+    Prefers 192.168.x.x addresses, otherwise returns the first non-localhost address.
+    """
+    addresses = []
+
+    # Linux: ask the kernel for each interface address directly
+    if fcntl is not None and hasattr(socket, 'if_nameindex'):
+        try:
+            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            try:
+                for _, name in socket.if_nameindex():
+                    if name.startswith('lo'):
+                        continue
+                    ip = _ipv4_for_interface(s, name)
+                    if ip:
+                        addresses.append(ip)
+            finally:
+                s.close()
+        except OSError:
+            pass
+
+    # macOS/other: resolve the host name
+    if not addresses:
+        try:
+            infos = socket.getaddrinfo(socket.gethostname(), None, socket.AF_INET)
+            addresses = [info[4][0] for info in infos]
+        except OSError:
+            pass
+
+    # Filter for local network addresses (192.168.x.x)
+    for ip in addresses:
+        if ip.startswith('192.168.') and ip != '192.168.1.1':
+            return ip
+
+    # If no 192.168.x.x found, return first non-localhost
+    for ip in addresses:
+        if not ip.startswith('127.'):
+            return ip
 
     return None
 
@@ -61,13 +128,27 @@ def detect_local_ip() -> Optional[str]:
     Detect the local IP address using multiple methods.
     Returns the most likely local network IP.
     """
-    # Try socket method first (more reliable)
+    # Fixed address from the environment skips all probing
+    ip = os.environ.get(LOCAL_IP_ENV_VAR, '').strip()
+    if ip:
+        try:
+            socket.inet_aton(ip)
+            return ip
+        except OSError:
+            print(f"Warning: Ignoring invalid {LOCAL_IP_ENV_VAR}: {ip}")
+
+    # Try the routing table first (Linux, no network round-trip)
+    ip = get_local_ip_procroute()
+    if ip and not ip.startswith('127.'):
+        return ip
+
+    # Then the socket method
     ip = get_local_ip_socket()
     if ip and not ip.startswith('127.'):
         return ip
 
-    # Fall back to ifconfig
-    ip = get_local_ip_ifconfig()
+    # Fall back to interface enumeration
+    ip = get_local_ip_interfaces()
     if ip:
         return ip
 
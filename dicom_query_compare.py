@@ -12,39 +12,133 @@ License: MIT
 
 import argparse
 import atexit
+import hashlib
 import json
 import os
+import random
 import signal
 import socket
 import sys
 import threading
 import time
+import urllib.error
+import urllib.request
 import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
 from datetime import datetime, timedelta
+from io import BytesIO
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 
+from pydicom import config as pydicom_config, dcmread
 from pydicom.dataset import Dataset
+from pydicom.datadict import tag_for_keyword
+from pydicom.tag import Tag
 from pydicom.uid import (
     JPEG2000Lossless,
     ExplicitVRLittleEndian,
     ImplicitVRLittleEndian
 )
-from pynetdicom import AE, debug_logger, evt
+from pynetdicom import AE, _config as pynetdicom_config, build_role, debug_logger, evt
+from pynetdicom.pdu_primitives import SOPClassExtendedNegotiation
 from pynetdicom.sop_class import (
     StudyRootQueryRetrieveInformationModelFind,
+    StudyRootQueryRetrieveInformationModelGet,
     StudyRootQueryRetrieveInformationModelMove,
-    Verification as VerificationSOPClass
+    Verification as VerificationSOPClass,
+    CTImageStorage, MRImageStorage, UltrasoundImageStorage,
+    SecondaryCaptureImageStorage, XRayAngiographicImageStorage,
+    XRayRadiofluoroscopicImageStorage, NuclearMedicineImageStorage,
+    PositronEmissionTomographyImageStorage,
+    RTImageStorage, RTDoseStorage, RTStructureSetStorage,
+    DigitalXRayImageStorageForPresentation,
+    DigitalXRayImageStorageForProcessing,
+    ComputedRadiographyImageStorage,
+    EnhancedCTImageStorage, EnhancedMRImageStorage,
+    EnhancedXAImageStorage, EnhancedXRFImageStorage
 )
 
-# Suppress pydicom validation warnings for malformed UIDs from remote PACS
+try:
+    import orjson  # Optional: faster config (de)serialization
+except ImportError:
+    orjson = None
+
+# Don't validate values read from C-FIND responses and received files (malformed UIDs
+# from remote PACS are common), and suppress the warnings pydicom still emits.
+# The setting is process-wide, so it also covers the files our Storage SCP receives and
+# writes. Read validation never rejects data in pydicom's default WARN mode, and its
+# warnings were filtered below anyway, so nothing that was visible before is hidden;
+# malformed values are stored exactly as they arrive. It cannot be limited to one code
+# path because C-FIND decoding and the SCP run in parallel threads.
+pydicom_config.settings.reading_validation_mode = pydicom_config.IGNORE
 warnings.filterwarnings('ignore', category=UserWarning, module='pydicom.valuerep')
 
+# pynetdicom pretty-prints every C-FIND identifier and binds PDU/DIMSE logging handlers
+# even when nothing is logged; --debug turns both back on (see enable_network_debugging())
+pynetdicom_config.LOG_REQUEST_IDENTIFIERS = False
+pynetdicom_config.LOG_RESPONSE_IDENTIFIERS = False
+pynetdicom_config.LOG_HANDLER_LEVEL = "none"
+
 
 CONFIG_FILE = "dicom_config.json"
 STABILITY_TRACKER_FILE = "series_stability.json"
+LOCAL_INVENTORY_FILE = "local_inventory.json"
 PREFERENCES_FILE = "dicom_preferences.json"
 DEFAULT_OSIRIX_PATH = "~/Documents/OsiriX Data/INCOMING.noindex"
+QUERY_WORKERS = 8  # Parallel C-FIND workers for series queries
+TRANSFER_WORKERS = 4  # Default concurrent C-MOVEs for transfer_series_parallel()
+IMAGE_MOVE_WORKERS = 1  # Default concurrent IMAGE-level C-MOVEs for the missing images of one series
+NETWORK_TIMEOUT = 60  # Seconds without network activity before an association is aborted
+ASSOCIATION_IDLE_TIMEOUT = 30  # Seconds a pooled association may sit unused before it is renewed
+LOCAL_IP_CACHE_TTL = 300  # Seconds before detect_local_ip() probes again
+LOCAL_IP_ENV_VAR = "DICOM_MOVER_LOCAL_IP"  # Fixed local IP that replaces auto-detection
+IDLE_RECHECK_INTERVAL = 600  # Seconds an unchanged study list may skip the series comparison
+INVENTORY_MAX_AGE = 3600  # Seconds a verified local series count is trusted without a C-FIND
+IMAGE_LIST_CACHE_TTL = 600  # Seconds a remote image list is reused while the series count is unchanged
+CYCLE_WAIT = 60  # Seconds between sync cycles that transferred nothing
+ACTIVE_CYCLE_WAIT = 10  # Seconds before the next cycle after one that transferred a few images
+RELOAD_POLL_INTERVAL = 1  # Seconds between checks for a SIGHUP reload request while waiting
+TRANSFER_ORDERS = ("given", "small-first", "large-first")  # Choices for --order
+
+# Status block printed before each series transfer
+TRANSFER_HEADER_FORMAT = (
+    "[%s] [%d/%d] C-MOVE START\n"
+    "  Patient: %s\n"
+    "  Date: %s\n"
+    "  Series: %s (%s) - %s\n"
+    "  Description: %.60s\n"
+)
+
+# Storage SOP classes accepted by the Storage SCP and negotiated for C-GET retrieval
+STORAGE_SOP_CLASSES = [
+    CTImageStorage, MRImageStorage, UltrasoundImageStorage,
+    SecondaryCaptureImageStorage, XRayAngiographicImageStorage,
+    XRayRadiofluoroscopicImageStorage, NuclearMedicineImageStorage,
+    PositronEmissionTomographyImageStorage,
+    RTImageStorage, RTDoseStorage, RTStructureSetStorage,
+    DigitalXRayImageStorageForPresentation,
+    DigitalXRayImageStorageForProcessing,
+    ComputedRadiographyImageStorage,
+    EnhancedCTImageStorage, EnhancedMRImageStorage,
+    EnhancedXAImageStorage, EnhancedXRFImageStorage
+]
+
+# C-FIND response values read by the query methods, as tags (see identifier_strings())
+STUDY_RESULT_TAGS = tuple(Tag(tag_for_keyword(keyword)) for keyword in (
+    'StudyInstanceUID', 'StudyDate', 'PatientID', 'PatientName', 'StudyDescription',
+    'StudyTime', 'NumberOfStudyRelatedInstances'))
+SERIES_RESULT_TAGS = tuple(Tag(tag_for_keyword(keyword)) for keyword in (
+    'SeriesInstanceUID', 'SeriesNumber', 'NumberOfSeriesRelatedInstances', 'Modality',
+    'SeriesDescription', 'StudyInstanceUID'))
+SOP_INSTANCE_UID_TAG = Tag(tag_for_keyword('SOPInstanceUID'))
+PENDING_STATUSES = frozenset((0xFF00, 0xFF01))  # C-FIND statuses that carry a match
+
+# (monotonic timestamp, ip) of the last detect_local_ip() probe
+_local_ip_cache: Optional[tuple] = None
+
+# (epoch second, "HH:MM:SS") of the last clock_time() call
+_clock_cache: tuple = (-1, "")
 
 # Transfer syntax mapping
 TRANSFER_SYNTAX_MAP = {
@@ -54,16 +148,172 @@ TRANSFER_SYNTAX_MAP = {
 }
 
 
+@contextmanager
+def buffered_output():
+    """
+    Temporarily turn off line buffering of stdout on a terminal.
+
+    print() inside the block no longer causes one write() per line; callers flush
+    explicitly at sensible points and everything is flushed when the block exits.
+    """
+    stream = sys.stdout
+    line_buffering = getattr(stream, 'line_buffering', False) and hasattr(stream, 'reconfigure')
+    if line_buffering:
+        stream.reconfigure(line_buffering=False)
+    try:
+        yield
+    finally:
+        stream.flush()
+        if line_buffering:
+            stream.reconfigure(line_buffering=True)
+
+
+def load_json(raw: bytes):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def read_json_file(path: str):
+    """Read a JSON file, using orjson when it is installed"""
+    return load_json(Path(path).read_bytes())
+
+
+def dump_json(data, indent: bool = True) -> bytes:
+    """Serialize data as JSON (indented unless indent=False), using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data, separators=(',', ':')).encode()
+
+
+def write_json_file(path: str, data, indent: bool = True):
+    """Write data as JSON (indented unless indent=False), using orjson when it is installed"""
+    Path(path).write_bytes(dump_json(data, indent))
+
+
+def content_hash(serialized: bytes) -> bytes:
+    """Short digest of serialized state, used to skip writing unchanged files"""
+    return hashlib.blake2b(serialized, digest_size=16).digest()
+
+
 def get_transfer_syntax_uid(syntax_name: str):
     """Get the UID object for a transfer syntax name"""
     return TRANSFER_SYNTAX_MAP.get(syntax_name, JPEG2000Lossless)
 
 
+def parse_count(value) -> int:
+    """Convert a Number of ... Related Instances value (IS or string) to int, 0 if unusable"""
+    if isinstance(value, int):
+        return int(value) if value >= 0 else 0
+    return int(value) if value and str(value).isdigit() else 0
+
+
+def identifier_strings(identifier: Dataset, tags: tuple) -> List[str]:
+    """
+    Read several values of a C-FIND response identifier as strings.
+
+    Elements are looked up by tag, which skips the keyword lookup of getattr();
+    missing or empty elements give ''.
+    """
+    values = []
+    for tag in tags:
+        elem = identifier.get(tag)
+        values.append('' if elem is None or elem.value is None else str(elem.value))
+    return values
+
+
+def split_multipart(body: bytes, content_type: str) -> List[bytes]:
+    """
+    Split a multipart/related HTTP body (as returned by WADO-RS) into its part payloads.
+
+    Args:
+        body: Raw response body
+        content_type: Value of the Content-Type header (contains the boundary)
+
+    Returns:
+        List of part bodies without their MIME headers
+    """
+    boundary = None
+    for param in content_type.split(';'):
+        key, _, value = param.strip().partition('=')
+        if key.lower() == 'boundary':
+            boundary = value.strip('"')
+    if not boundary:
+        return []
+
+    parts = []
+    for chunk in body.split(b'--' + boundary.encode()):
+        if chunk.startswith(b'--'):
+            break  # Closing delimiter
+        header_end = chunk.find(b'\r\n\r\n')
+        if header_end < 0:
+            continue
+        payload = chunk[header_end + 4:]
+        if payload.endswith(b'\r\n'):
+            payload = payload[:-2]
+        if payload:
+            parts.append(payload)
+    return parts
+
+
+def make_query_template(level: str, **keywords) -> Dict:
+    """
+    Build the constant part of a C-FIND query as a {tag: DataElement} mapping.
+
+    Use Dataset(dict(template)) to get a new query; the shared elements must
+    not be modified, only new keywords may be added to the copy.
+    """
+    ds = Dataset()
+    ds.QueryRetrieveLevel = level
+    for keyword, value in keywords.items():
+        setattr(ds, keyword, value)
+    return {elem.tag: elem for elem in ds}
+
+
+def enable_network_debugging():
+    """Log pynetdicom association and DIMSE details, including all identifiers (--debug)"""
+    pynetdicom_config.LOG_REQUEST_IDENTIFIERS = True
+    pynetdicom_config.LOG_RESPONSE_IDENTIFIERS = True
+    pynetdicom_config.LOG_HANDLER_LEVEL = "standard"
+    debug_logger()
+
+
+def clock_time() -> str:
+    """Current local time as HH:MM:SS, formatted at most once per second"""
+    global _clock_cache
+    now = int(time.time())
+    second, text = _clock_cache
+    if now != second:
+        text = time.strftime("%H:%M:%S", time.localtime(now))
+        _clock_cache = (now, text)
+    return text
+
+
 def detect_local_ip() -> Optional[str]:
     """
     Detect the local IP address automatically.
     Returns the most likely local network IP.
+
+    A valid IPv4 address in the DICOM_MOVER_LOCAL_IP environment variable is
+    returned without probing. The result is cached for LOCAL_IP_CACHE_TTL seconds.
     """
+    global _local_ip_cache
+    # Fixed address from the environment skips all probing
+    ip = os.environ.get(LOCAL_IP_ENV_VAR, '').strip()
+    if ip:
+        try:
+            socket.inet_aton(ip)
+            return ip
+        except OSError:
+            print(f"Warning: Ignoring invalid {LOCAL_IP_ENV_VAR}: {ip}")
+
+    now = time.monotonic()
+    if _local_ip_cache is not None and now - _local_ip_cache[0] < LOCAL_IP_CACHE_TTL:
+        return _local_ip_cache[1]
+
     try:
         # Create a socket to determine which interface would be used
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -72,9 +322,12 @@ def detect_local_ip() -> Optional[str]:
         s.connect(("8.8.8.8", 80))
         local_ip = s.getsockname()[0]
         s.close()
-        return local_ip if not local_ip.startswith('127.') else None
+        local_ip = local_ip if not local_ip.startswith('127.') else None
     except Exception:
-        return None
+        local_ip = None
+
+    _local_ip_cache = (now, local_ip)
+    return local_ip
 
 
 class SeriesStabilityTracker:
@@ -86,27 +339,57 @@ class SeriesStabilityTracker:
 
     def __init__(self, tracker_file: str = STABILITY_TRACKER_FILE):
         self.tracker_file = tracker_file
-        self.series_states: Dict[str, Dict] = {}
+        # Keyed by (remote node name, study UID, series UID); stored as "node|study|series" in the file
+        self.series_states: Dict[tuple, Dict] = {}
+        # Remote node name -> keys of its series in series_states
+        self._by_node: Dict[str, set] = {}
+        self._dirty = False  # Unsaved changes since the last load/save
+        self._saved_hash: Optional[bytes] = None  # content_hash() of the file contents
         self.load()
 
-    def _make_key(self, remote_node_name: str, study_uid: str, series_uid: str) -> str:
-        """Create a unique key for a series"""
-        return f"{remote_node_name}|{study_uid}|{series_uid}"
-
     def load(self):
         """Load tracker state from file"""
         if os.path.exists(self.tracker_file):
             try:
-                with open(self.tracker_file, 'r') as f:
-                    self.series_states = json.load(f)
-            except (json.JSONDecodeError, IOError):
+                # UIDs never contain '|', so split from the right in case a node name does
+                self.series_states = {tuple(key.rsplit('|', 2)): state
+                                      for key, state in read_json_file(self.tracker_file).items()
+                                      if key.count('|') >= 2}
+            except (ValueError, IOError, AttributeError):
                 self.series_states = {}
+            self._convert_iso_timestamps()
+        self._by_node = {}
+        for key in self.series_states:
+            self._by_node.setdefault(key[0], set()).add(key)
+        self._dirty = False
+
+    def _convert_iso_timestamps(self):
+        """Convert ISO timestamps written by older versions to epoch seconds"""
+        for key, state in list(self.series_states.items()):
+            try:
+                for field in ('last_seen', 'stable_since'):
+                    if isinstance(state.get(field), str):
+                        state[field] = datetime.fromisoformat(state[field]).timestamp()
+            except (ValueError, AttributeError):
+                del self.series_states[key]  # Unreadable entry, the series is simply seen anew
 
     def save(self):
-        """Save tracker state to file"""
+        """Save tracker state to file if it changed (written to a temp file, then renamed)"""
+        if not self._dirty:
+            return
+        serialized = dump_json({'|'.join(key): state for key, state in self.series_states.items()},
+                               indent=False)
+        digest = content_hash(serialized)
+        if digest == self._saved_hash:
+            self._dirty = False  # Changes cancelled out (e.g. added and removed again)
+            return
+        tmp_file = self.tracker_file + '.tmp'
         try:
-            with open(self.tracker_file, 'w') as f:
-                json.dump(self.series_states, f, indent=2)
+            Path(tmp_file).write_bytes(serialized)
+            # Atomic on POSIX: an interrupted save never leaves a truncated tracker behind
+            os.replace(tmp_file, self.tracker_file)
+            self._dirty = False
+            self._saved_hash = digest
         except IOError as e:
             print(f"Warning: Could not save stability tracker: {e}")
 
@@ -118,8 +401,10 @@ class SeriesStabilityTracker:
         Returns:
             True if series is stable (unchanged from last cycle), False otherwise
         """
-        key = self._make_key(remote_node_name, study_uid, series_uid)
-        now = datetime.now().isoformat()
+        key = (remote_node_name, study_uid, series_uid)
+        now = time.time()
+        self._dirty = True
+        self._by_node.setdefault(remote_node_name, set()).add(key)
 
         if key in self.series_states:
             old_count = self.series_states[key]['image_count']
@@ -127,7 +412,9 @@ class SeriesStabilityTracker:
             if old_count == image_count:
                 # Image count unchanged - series is stable
                 self.series_states[key]['last_seen'] = now
-                self.series_states[key]['stable_since'] = self.series_states[key].get('stable_since', now)
+                # New entries store stable_since=None, so .get(..., now) would keep the None
+                if self.series_states[key].get('stable_since') is None:
+                    self.series_states[key]['stable_since'] = now
                 return True
             else:
                 # Image count changed - series is still growing
@@ -148,43 +435,171 @@ class SeriesStabilityTracker:
 
     def mark_transferred(self, remote_node_name: str, study_uid: str, series_uid: str):
         """Remove series from tracker after successful transfer"""
-        key = self._make_key(remote_node_name, study_uid, series_uid)
+        key = (remote_node_name, study_uid, series_uid)
         if key in self.series_states:
-            del self.series_states[key]
+            self._remove(key)
+
+    def _remove(self, key: tuple):
+        """Delete a series from the states and the per-node index"""
+        del self.series_states[key]
+        self._by_node[key[0]].discard(key)
+        self._dirty = True
+
+    def get_node_series(self, remote_node_name: str) -> set:
+        """Return the (node, study UID, series UID) keys tracked for a remote node"""
+        return self._by_node.get(remote_node_name, set())
+
+    def has_pending(self, remote_node_name: str) -> bool:
+        """Return True if a series of this node is still waiting to become stable"""
+        return any(self.series_states[key].get('stable_since') is None
+                   for key in self.get_node_series(remote_node_name))
 
     def cleanup_old_entries(self, max_age_hours: int = 48):
         """Remove series that haven't been seen in max_age_hours"""
-        now = datetime.now()
-        keys_to_remove = []
-
-        for key, state in self.series_states.items():
-            try:
-                last_seen = datetime.fromisoformat(state['last_seen'])
-                age_hours = (now - last_seen).total_seconds() / 3600
-                if age_hours > max_age_hours:
-                    keys_to_remove.append(key)
-            except (ValueError, KeyError):
-                # Invalid timestamp - remove entry
-                keys_to_remove.append(key)
+        cutoff = time.time() - max_age_hours * 3600
+        keys_to_remove = [key for key, state in self.series_states.items()
+                          if not isinstance(state.get('last_seen'), (int, float)) or state['last_seen'] < cutoff]
 
         for key in keys_to_remove:
-            del self.series_states[key]
+            self._remove(key)
 
         if keys_to_remove:
             print(f"Cleaned up {len(keys_to_remove)} old series from stability tracker")
 
 
+class LocalInventory:
+    """
+    Remembers series that were found complete on the local server.
+
+    If every remote series of a study was verified complete recently, the local
+    C-FIND for that study can be skipped. Entries expire after max_age seconds so
+    that changes on the local server are still noticed.
+    """
+
+    def __init__(self, inventory_file: str = LOCAL_INVENTORY_FILE, max_age: float = INVENTORY_MAX_AGE):
+        self.inventory_file = inventory_file
+        self.max_age = max_age
+        self.series_counts: Dict[str, Dict] = {}
+        self.lock = threading.Lock()
+        self._saved_hash: Optional[bytes] = None  # content_hash() of the last save
+        self.load()
+
+    def _make_key(self, study_uid: str, series_uid: str) -> str:
+        """Create a unique key for a series"""
+        return f"{study_uid}|{series_uid}"
+
+    def load(self):
+        """Load inventory from file, dropping expired entries"""
+        if os.path.exists(self.inventory_file):
+            try:
+                self.series_counts = read_json_file(self.inventory_file)
+            except (ValueError, IOError):
+                self.series_counts = {}
+        self.purge()
+
+    def save(self):
+        """Save inventory to file, unless it is unchanged since the last save (e.g. idle cycles)"""
+        self.purge()
+        try:
+            with self.lock:
+                serialized = dump_json(self.series_counts)
+            digest = content_hash(serialized)
+            if digest != self._saved_hash:
+                Path(self.inventory_file).write_bytes(serialized)
+                self._saved_hash = digest
+        except IOError as e:
+            print(f"Warning: Could not save local inventory: {e}")
+
+    def purge(self):
+        """Remove entries older than max_age"""
+        cutoff = time.time() - self.max_age
+        with self.lock:
+            self.series_counts = {key: entry for key, entry in self.series_counts.items()
+                                  if entry.get('verified', 0) >= cutoff}
+
+    def record(self, study_uid: str, series_uid: str, image_count: int):
+        """Record a series that was just seen complete on the local server"""
+        with self.lock:
+            self.series_counts[self._make_key(study_uid, series_uid)] = {
+                'image_count': image_count,
+                'verified': time.time()
+            }
+
+    def local_series_if_complete(self, study_uid: str,
+                                 remote_series_list: List['DicomSeries']) -> Optional[List['DicomSeries']]:
+        """
+        Return the local series of a study from the inventory if all remote series are covered.
+
+        Returns:
+            List of DicomSeries with the recorded local counts, or None if a local C-FIND is needed
+        """
+        cutoff = time.time() - self.max_age
+        local_series = []
+        with self.lock:
+            for series in remote_series_list:
+                entry = self.series_counts.get(self._make_key(study_uid, series.series_uid))
+                if entry is None or entry['verified'] < cutoff or entry['image_count'] < series.num_images:
+                    return None
+                local_series.append(DicomSeries(series.series_uid, series.series_number,
+                                                entry['image_count'], series.modality,
+                                                series.series_description))
+        return local_series
+
+
+class IdleStudyCache:
+    """
+    Remembers the remote study list of the last cycle that found nothing to transfer.
+
+    While the remote returns the same studies with the same instance counts, the
+    per-study series comparison (two C-FINDs per study) can be skipped. A full
+    comparison is still forced every max_age seconds to notice local changes.
+    """
+
+    def __init__(self, max_age: float = IDLE_RECHECK_INTERVAL):
+        self.max_age = max_age
+        self.fingerprint: Optional[frozenset] = None
+        self.checked_at = 0.0
+
+    @staticmethod
+    def _fingerprint(studies: List['DicomStudy']) -> Optional[frozenset]:
+        """Study UIDs with their instance counts, or None if a count is missing"""
+        if any(study.num_images <= 0 for study in studies):
+            return None  # Without instance counts a growing study would go unnoticed
+        return frozenset((study.study_uid, study.num_images) for study in studies)
+
+    def is_unchanged(self, studies: List['DicomStudy']) -> bool:
+        """Return True if the studies match the remembered idle state"""
+        if self.fingerprint is None or time.monotonic() - self.checked_at > self.max_age:
+            return False
+        return self._fingerprint(studies) == self.fingerprint
+
+    def remember(self, studies: List['DicomStudy']):
+        """Store the studies of a cycle in which everything was complete"""
+        self.fingerprint = self._fingerprint(studies)
+        self.checked_at = time.monotonic()
+
+    def clear(self):
+        """Forget the idle state"""
+        self.fingerprint = None
+
+
 class DicomNode:
     """Represents a DICOM node configuration"""
 
+    __slots__ = ('name', 'ae_title', 'ip_address', 'port', 'transfer_syntax',
+                 'local_config', 'wado_rs_url', 'supports_cget')
+
     def __init__(self, name: str, ae_title: str, ip_address: str, port: int,
-                 transfer_syntax: str = "JPEG2000Lossless", local_config: Optional[Dict] = None):
+                 transfer_syntax: str = "JPEG2000Lossless", local_config: Optional[Dict] = None,
+                 wado_rs_url: Optional[str] = None, supports_cget: bool = False):
         self.name = name
         self.ae_title = ae_title
         self.ip_address = ip_address
         self.port = port
         self.transfer_syntax = transfer_syntax
         self.local_config = local_config  # How this node sees the local server
+        self.wado_rs_url = wado_rs_url  # DICOMweb base URL; if set, series are retrieved via WADO-RS
+        self.supports_cget = supports_cget  # Retrieve with C-GET instead of C-MOVE
 
     def __repr__(self):
         return f"DicomNode({self.name}, {self.ae_title}@{self.ip_address}:{self.port}, {self.transfer_syntax})"
@@ -199,6 +614,10 @@ class DicomNode:
         }
         if self.local_config:
             data["local_config"] = self.local_config
+        if self.wado_rs_url:
+            data["wado_rs_url"] = self.wado_rs_url
+        if self.supports_cget:
+            data["supports_cget"] = True
         return data
 
     @classmethod
@@ -209,7 +628,9 @@ class DicomNode:
             ip_address=data["ip_address"],
             port=data["port"],
             transfer_syntax=data.get("transfer_syntax", "JPEG2000Lossless"),
-            local_config=data.get("local_config")  # Optional per-remote local config
+            local_config=data.get("local_config"),  # Optional per-remote local config
+            wado_rs_url=data.get("wado_rs_url"),  # Optional DICOMweb retrieval
+            supports_cget=data.get("supports_cget", False)  # Optional C-GET retrieval
         )
 
 
@@ -220,35 +641,47 @@ class DicomConfig:
         self.config_file = config_file
         self.local_node: Optional[DicomNode] = None
         self.remote_nodes: Dict[str, DicomNode] = {}  # Dictionary of remote nodes by short name
+        self._mtime_ns: Optional[int] = None  # Config file mtime at the last load/save
 
-    def load(self, auto_detect_local_ip: bool = True) -> bool:
+    def load(self, auto_detect_local_ip: bool = True, force: bool = False) -> bool:
         """
         Load configuration from file. Returns True if successful.
 
         Args:
             auto_detect_local_ip: If True, automatically detect and update local IP address
+            force: Re-parse the file even if its modification time is unchanged
         """
-        if not os.path.exists(self.config_file):
+        # One stat call instead of exists() + open(); also tells us if the file changed
+        try:
+            mtime_ns = os.stat(self.config_file).st_mtime_ns
+        except OSError:
             return False
 
         try:
-            with open(self.config_file, 'r') as f:
-                data = json.load(f)
-
-            self.local_node = DicomNode.from_dict(data["local"])
-
-            # Load remote nodes - support both old single 'remote' and new 'remotes' format
-            if "remotes" in data:
-                # New format: multiple remote nodes
-                for short_name, node_data in data["remotes"].items():
-                    self.remote_nodes[short_name] = DicomNode.from_dict(node_data)
-            elif "remote" in data:
-                # Old format: single remote node - migrate to new format with default name
-                remote_node = DicomNode.from_dict(data["remote"])
-                # Use the node's name as short name, or fallback to "default"
-                short_name = remote_node.name.lower().replace(" ", "_") if remote_node.name else "default"
-                self.remote_nodes[short_name] = remote_node
-                print(f"Migrated old config format: remote node now accessible as '{short_name}'")
+            # Only re-parse if the file changed since the last load/save
+            if force or mtime_ns != self._mtime_ns or self.local_node is None:
+                data = read_json_file(self.config_file)
+
+                local_node = DicomNode.from_dict(data["local"])
+                remote_nodes = {}
+
+                # Load remote nodes - support both old single 'remote' and new 'remotes' format
+                if "remotes" in data:
+                    # New format: multiple remote nodes
+                    for short_name, node_data in data["remotes"].items():
+                        remote_nodes[short_name] = DicomNode.from_dict(node_data)
+                elif "remote" in data:
+                    # Old format: single remote node - migrate to new format with default name
+                    remote_node = DicomNode.from_dict(data["remote"])
+                    # Use the node's name as short name, or fallback to "default"
+                    short_name = remote_node.name.lower().replace(" ", "_") if remote_node.name else "default"
+                    remote_nodes[short_name] = remote_node
+                    print(f"Migrated old config format: remote node now accessible as '{short_name}'")
+
+                # Replace the nodes only after the whole file parsed, so a broken edit keeps the old config
+                self.local_node = local_node
+                self.remote_nodes = remote_nodes
+                self._mtime_ns = mtime_ns
 
             # Auto-detect local IP if enabled
             if auto_detect_local_ip:
@@ -261,7 +694,7 @@ class DicomConfig:
                     print(f"   Configuration automatically updated")
 
             return True
-        except (json.JSONDecodeError, KeyError) as e:
+        except (json.JSONDecodeError, KeyError, OSError) as e:
             print(f"Error loading config: {e}")
             return False
 
@@ -272,8 +705,8 @@ class DicomConfig:
             "remotes": {short_name: node.to_dict() for short_name, node in self.remote_nodes.items()}
         }
 
-        with open(self.config_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        write_json_file(self.config_file, data)
+        self._mtime_ns = os.stat(self.config_file).st_mtime_ns
 
         print(f"Configuration saved to {self.config_file}")
 
@@ -319,6 +752,11 @@ class DicomConfig:
             else:
                 transfer_syntax = "JPEG2000Lossless"
 
+            wado_rs_url = input("  DICOMweb WADO-RS base URL (optional, empty = use C-MOVE): ").strip() or None
+            supports_cget = False
+            if not wado_rs_url:
+                supports_cget = input("  Retrieve with C-GET instead of C-MOVE? (y/n, default=n): ").strip().lower() == 'y'
+
             # Ask for remote-specific local configuration
             print("\n  Local Configuration (how this remote knows YOU):")
             use_custom = input("    Does this remote know you differently than default? (y/n, default=n): ").strip().lower()
@@ -337,7 +775,8 @@ class DicomConfig:
                 print(f"    ✓ Custom local config: {local_ae}@{local_ip}:{local_port}")
 
             self.remote_nodes[short_name] = DicomNode(remote_name, remote_ae, remote_ip, remote_port,
-                                                     transfer_syntax, local_config)
+                                                     transfer_syntax, local_config, wado_rs_url,
+                                                     supports_cget)
             print(f"  ✓ Remote node '{short_name}' added with {transfer_syntax}")
 
             add_more = input("\n  Add another remote node? (y/n): ").strip().lower()
@@ -359,6 +798,8 @@ class DicomConfig:
 class DicomSeries:
     """Represents a DICOM series"""
 
+    __slots__ = ('series_uid', 'series_number', 'num_images', 'modality', 'series_description')
+
     def __init__(self, series_uid: str, series_number: str, num_images: int,
                  modality: str = "", series_description: str = ""):
         self.series_uid = series_uid
@@ -374,6 +815,9 @@ class DicomSeries:
 class DicomStudy:
     """Represents a DICOM study"""
 
+    __slots__ = ('study_uid', 'study_date', 'patient_id', 'patient_name', 'study_description',
+                 'study_time', 'num_images', 'series', '_date_formatted')
+
     def __init__(self, study_uid: str, study_date: str, patient_id: str,
                  patient_name: str = "", study_description: str = "", study_time: str = "",
                  num_images: int = 0):
@@ -385,10 +829,19 @@ class DicomStudy:
         self.study_time = study_time
         self.num_images = num_images
         self.series: List[DicomSeries] = []
+        self._date_formatted: Optional[str] = None
 
     def __repr__(self):
         return f"Study({self.study_uid}, {self.study_date}, {self.patient_id})"
 
+    @property
+    def date_formatted(self) -> str:
+        """Study date as YYYY-MM-DD (computed on first use)"""
+        if self._date_formatted is None:
+            d = self.study_date
+            self._date_formatted = f"{d[:4]}-{d[4:6]}-{d[6:8]}" if len(d) == 8 else d
+        return self._date_formatted
+
     def __eq__(self, other):
         return self.study_uid == other.study_uid
 
@@ -399,12 +852,166 @@ class DicomStudy:
 class DicomQueryClient:
     """Client for querying DICOM servers"""
 
-    def __init__(self, calling_ae_title: str = "QUERY_CLIENT"):
+    def __init__(self, calling_ae_title: str = "QUERY_CLIENT", max_association_requests: int = 0):
         self.calling_ae_title = calling_ae_title
-        self.ae = AE(ae_title=calling_ae_title)
+        # Requests sent over one persistent association before it is renewed (0 = no limit)
+        self.max_association_requests = max_association_requests
+        # One long-lived AE for C-FIND and C-ECHO; C-MOVE uses the per-syntax AEs of _get_move_ae()
+        self.ae = self._new_ae()
         self.ae.add_requested_context(StudyRootQueryRetrieveInformationModelFind)
-        self.ae.add_requested_context(StudyRootQueryRetrieveInformationModelMove)
-        # Note: Transfer syntax for C-MOVE is set per-node in move_series() method
+        self.ae.add_requested_context(VerificationSOPClass)
+
+        # Associations kept open inside persistent_associations(), one cache per thread
+        self._keep_alive = 0  # Nesting depth of persistent_associations() blocks
+        self._thread_state = threading.local()
+        self._open_associations = []  # (association, thread that opened it)
+        self._associations_lock = threading.Lock()
+
+        # C-MOVE and C-GET AEs by transfer syntax name, built on first use
+        self._move_aes: Dict[str, AE] = {}
+        self._get_aes: Dict[str, AE] = {}
+
+        # Constant C-FIND return keys, copied into a new Dataset per query
+        self._study_find_template = make_query_template(
+            'STUDY', StudyInstanceUID='', PatientName='', StudyDescription='', StudyTime='',
+            NumberOfStudyRelatedInstances='')
+        self._series_find_template = make_query_template(
+            'SERIES', SeriesInstanceUID='', SeriesNumber='', Modality='', SeriesDescription='',
+            NumberOfSeriesRelatedInstances='')
+        self._image_find_template = make_query_template('IMAGE', SOPInstanceUID='')
+        # C-MOVE/C-GET identifiers only add the UIDs to the query level
+        self._study_retrieve_template = make_query_template('STUDY')
+        self._series_retrieve_template = make_query_template('SERIES')
+        self._image_retrieve_template = make_query_template('IMAGE')
+
+        # Relational C-FIND (series of all studies of a date range in one query), see query_series_by_date()
+        self._relational_ae = self._new_ae()
+        self._relational_ae.add_requested_context(StudyRootQueryRetrieveInformationModelFind)
+        self._relational_item = SOPClassExtendedNegotiation()
+        self._relational_item.sop_class_uid = StudyRootQueryRetrieveInformationModelFind
+        self._relational_item.service_class_application_information = b'\x01'
+        self._relational_unsupported = set()  # (ip, port, ae_title) of nodes that declined it
+
+        # (ip, port, ae_title, series UID) -> (monotonic time, image UIDs), see query_images()
+        self._image_cache: Dict[tuple, tuple] = {}
+
+        # Series C-FINDs that failed (no association, error status or exception); a failed
+        # query returns an empty list, so callers compare this counter to notice it
+        self.failed_series_queries = 0
+        self._failures_lock = threading.Lock()
+
+    @contextmanager
+    def persistent_associations(self):
+        """
+        Reuse one association per node for all queries inside the block.
+
+        Without this, every query opens and releases its own association.
+        Blocks may be nested (e.g. one per sync cycle around the per-phase blocks) and
+        entered from several threads: leaving an inner block releases the associations
+        of worker threads that have finished, leaving the outermost block releases all.
+        """
+        with self._associations_lock:
+            self._keep_alive += 1
+        try:
+            yield self
+        finally:
+            with self._associations_lock:
+                self._keep_alive -= 1
+                if self._keep_alive:
+                    # Threads that are still running may still use their associations
+                    released = [(a, t) for a, t in self._open_associations if not t.is_alive()]
+                else:
+                    released = self._open_associations
+                self._open_associations = [entry for entry in self._open_associations
+                                           if entry not in released]
+            for assoc, _ in released:
+                if assoc.is_established:
+                    assoc.release()
+
+    def _new_ae(self) -> AE:
+        """Create an AE with our calling AE title and no limit on the received PDU size"""
+        ae = AE(ae_title=self.calling_ae_title)
+        ae.maximum_pdu_size = 0  # Unlimited: let the peer send the largest PDUs it supports
+        ae.network_timeout = NETWORK_TIMEOUT
+        return ae
+
+    def _get_move_ae(self, transfer_syntax: str) -> AE:
+        """Get the C-MOVE AE for a transfer syntax, creating it on first use"""
+        with self._associations_lock:
+            move_ae = self._move_aes.get(transfer_syntax)
+            if move_ae is None:
+                move_ae = self._new_ae()
+                # Node-specific transfer syntax preferred, Implicit VR always added as fallback
+                move_ae.add_requested_context(StudyRootQueryRetrieveInformationModelMove, [
+                    get_transfer_syntax_uid(transfer_syntax),
+                    ImplicitVRLittleEndian
+                ])
+                self._move_aes[transfer_syntax] = move_ae
+            return move_ae
+
+    def _get_get_ae(self, transfer_syntax: str) -> AE:
+        """Get the C-GET AE for a transfer syntax, creating it on first use"""
+        with self._associations_lock:
+            get_ae = self._get_aes.get(transfer_syntax)
+            if get_ae is None:
+                get_ae = self._new_ae()
+                syntax_uid = get_transfer_syntax_uid(transfer_syntax)
+                get_ae.add_requested_context(StudyRootQueryRetrieveInformationModelGet, [
+                    syntax_uid,
+                    ImplicitVRLittleEndian
+                ])
+                # C-GET returns the instances on the same association, so we act as Storage SCP
+                for storage_class in STORAGE_SOP_CLASSES:
+                    get_ae.add_requested_context(storage_class, list(dict.fromkeys([
+                        syntax_uid, ExplicitVRLittleEndian, ImplicitVRLittleEndian])))
+                self._get_aes[transfer_syntax] = get_ae
+            return get_ae
+
+    def _associate(self, node: DicomNode, ae: Optional[AE] = None, ext_neg: Optional[List] = None):
+        """Associate with a node, reusing a cached association if persistent mode is active"""
+        ae = ae or self.ae
+        if not self._keep_alive:
+            return ae.associate(node.ip_address, node.port, ae_title=node.ae_title, ext_neg=ext_neg)
+
+        cache = getattr(self._thread_state, 'associations', None)
+        if cache is None:
+            cache = self._thread_state.associations = {}
+
+        key = (id(ae), node.ip_address, node.port, node.ae_title)
+        assoc, uses, last_used = cache.get(key, (None, 0, 0.0))
+        now = time.monotonic()
+        if assoc is not None and assoc.is_established and (
+                (self.max_association_requests and uses >= self.max_association_requests)
+                or now - last_used > ASSOCIATION_IDLE_TIMEOUT):
+            # Batch limit reached or idle for long: release before the peer drops it on its own
+            with self._associations_lock:
+                self._open_associations.remove((assoc, threading.current_thread()))
+            assoc.release()
+        if assoc is None or not assoc.is_established:
+            assoc = ae.associate(node.ip_address, node.port, ae_title=node.ae_title, ext_neg=ext_neg)
+            uses = 0
+            if assoc.is_established:
+                with self._associations_lock:
+                    self._open_associations.append((assoc, threading.current_thread()))
+        cache[key] = (assoc, uses + 1, now)
+        return assoc
+
+    def _release(self, assoc):
+        """Release an association unless it is kept open by persistent mode"""
+        if not self._keep_alive:
+            assoc.release()
+            return
+        # Still in use by persistent mode: the idle time counts from the end of this request
+        cache = getattr(self._thread_state, 'associations', {})
+        for key, (cached, uses, _) in cache.items():
+            if cached is assoc:
+                cache[key] = (cached, uses, time.monotonic())
+                break
+
+    def _discard(self, assoc):
+        """Abort an association after an error so it is not reused"""
+        if assoc is not None and assoc.is_established:
+            assoc.abort()
 
     def query_studies(self, node: DicomNode, date_from: str = "", date_to: str = "",
                      patient_id: str = "") -> List[DicomStudy]:
@@ -427,9 +1034,8 @@ class DicomQueryClient:
         else:
             print(f"Date range: {date_from} to {date_to}")
 
-        # Create the C-FIND query dataset
-        ds = Dataset()
-        ds.QueryRetrieveLevel = 'STUDY'
+        # Create the C-FIND query dataset from the prebuilt template
+        ds = Dataset(dict(self._study_find_template))
 
         if patient_id:
             # Query by patient ID
@@ -440,17 +1046,12 @@ class DicomQueryClient:
             ds.StudyDate = f"{date_from}-{date_to}"  # Date range query
             ds.PatientID = ''
 
-        ds.StudyInstanceUID = ''
-        ds.PatientName = ''
-        ds.StudyDescription = ''
-        ds.StudyTime = ''
-        ds.NumberOfStudyRelatedInstances = ''
-
         studies = []
 
+        assoc = None
         try:
             # Associate with peer AE
-            assoc = self.ae.associate(node.ip_address, node.port, ae_title=node.ae_title)
+            assoc = self._associate(node)
 
             if assoc.is_established:
                 # Send the C-FIND request
@@ -459,19 +1060,18 @@ class DicomQueryClient:
                 for (status, identifier) in responses:
                     if status:
                         # If status is pending, we have results
-                        if status.Status in (0xFF00, 0xFF01):
+                        if status.Status in PENDING_STATUSES:
                             if identifier:
-                                num_images = identifier.get('NumberOfStudyRelatedInstances', '')
-                                num_images_int = int(num_images) if num_images and str(num_images).isdigit() else 0
-
+                                (study_uid, study_date, patient_id, patient_name, study_description,
+                                 study_time, num_images) = identifier_strings(identifier, STUDY_RESULT_TAGS)
                                 study = DicomStudy(
-                                    study_uid=str(identifier.get('StudyInstanceUID', '')),
-                                    study_date=str(identifier.get('StudyDate', '')),
-                                    patient_id=str(identifier.get('PatientID', '')),
-                                    patient_name=str(identifier.get('PatientName', '')),
-                                    study_description=str(identifier.get('StudyDescription', '')),
-                                    study_time=str(identifier.get('StudyTime', '')),
-                                    num_images=num_images_int
+                                    study_uid=study_uid,
+                                    study_date=study_date,
+                                    patient_id=patient_id,
+                                    patient_name=patient_name,
+                                    study_description=study_description,
+                                    study_time=study_time,
+                                    num_images=parse_count(num_images)
                                 )
                                 studies.append(study)
                         else:
@@ -479,45 +1079,47 @@ class DicomQueryClient:
                             break
                     else:
                         print('Connection timed out, was aborted or received invalid response')
+                        break
 
                 # Release the association
-                assoc.release()
+                self._release(assoc)
 
                 print(f"Found {len(studies)} studies")
             else:
                 print(f"Association rejected, aborted or never connected to {node.name}")
 
         except Exception as e:
+            self._discard(assoc)
             print(f"Error querying {node.name}: {e}")
 
         return studies
 
-    def query_series(self, node: DicomNode, study_uid: str) -> List[DicomSeries]:
+    def query_series(self, node: DicomNode, study_uid: str, series_uid: str = "") -> List[DicomSeries]:
         """
         Query series for a specific study.
 
         Args:
             node: DicomNode to query
             study_uid: Study Instance UID
+            series_uid: If set, only this series is matched (the node returns at most one result)
 
         Returns:
             List of DicomSeries objects
         """
-        # Create the C-FIND query dataset for series level
-        ds = Dataset()
-        ds.QueryRetrieveLevel = 'SERIES'
+        # Create the C-FIND query dataset for series level from the prebuilt template
+        ds = Dataset(dict(self._series_find_template))
         ds.StudyInstanceUID = study_uid
-        ds.SeriesInstanceUID = ''
-        ds.SeriesNumber = ''
-        ds.Modality = ''
-        ds.SeriesDescription = ''
-        ds.NumberOfSeriesRelatedInstances = ''
+        if series_uid:
+            # New element: the template's empty SeriesInstanceUID is shared and must not be changed
+            ds.add_new(SERIES_RESULT_TAGS[0], 'UI', series_uid)
 
         series_list = []
+        failed = True  # Until the C-FIND ended with a success status
 
+        assoc = None
         try:
             # Associate with peer AE
-            assoc = self.ae.associate(node.ip_address, node.port, ae_title=node.ae_title)
+            assoc = self._associate(node)
 
             if assoc.is_established:
                 # Send the C-FIND request
@@ -525,30 +1127,107 @@ class DicomQueryClient:
 
                 for (status, identifier) in responses:
                     if status:
-                        if status.Status in (0xFF00, 0xFF01):
+                        if status.Status in PENDING_STATUSES:
                             if identifier:
-                                num_images = identifier.get('NumberOfSeriesRelatedInstances', '')
-                                num_images_int = int(num_images) if num_images and str(num_images).isdigit() else 0
-
+                                (series_uid, series_number, num_images, modality, series_description,
+                                 _) = identifier_strings(identifier, SERIES_RESULT_TAGS)
                                 series = DicomSeries(
-                                    series_uid=str(identifier.get('SeriesInstanceUID', '')),
-                                    series_number=str(identifier.get('SeriesNumber', '')),
-                                    num_images=num_images_int,
-                                    modality=str(identifier.get('Modality', '')),
-                                    series_description=str(identifier.get('SeriesDescription', ''))
+                                    series_uid=series_uid,
+                                    series_number=series_number,
+                                    num_images=parse_count(num_images),
+                                    modality=modality,
+                                    series_description=series_description
                                 )
                                 series_list.append(series)
                         else:
+                            failed = status.Status != 0x0000
                             break
 
-                assoc.release()
+                self._release(assoc)
 
         except Exception as e:
+            self._discard(assoc)
             print(f"Error querying series: {e}")
 
+        if failed:
+            with self._failures_lock:
+                self.failed_series_queries += 1
         return series_list
 
-    def query_images(self, node: DicomNode, study_uid: str, series_uid: str) -> List[str]:
+    def query_series_by_date(self, node: DicomNode, date_from: str,
+                             date_to: str) -> Optional[Dict[str, List[DicomSeries]]]:
+        """
+        Query the series of all studies in a date range with one relational C-FIND.
+
+        Replaces one series-level C-FIND per study. Only used if the node accepts
+        relational queries in the extended negotiation; nodes that decline are
+        remembered and not asked again.
+
+        Args:
+            node: DicomNode to query
+            date_from: Start date in YYYYMMDD format
+            date_to: End date in YYYYMMDD format
+
+        Returns:
+            Dict of Study Instance UID to its DicomSeries, or None if the node
+            does not support relational queries (use query_series() instead)
+        """
+        node_key = (node.ip_address, node.port, node.ae_title)
+        if node_key in self._relational_unsupported:
+            return None
+
+        ds = Dataset(dict(self._series_find_template))
+        ds.StudyInstanceUID = ''
+        ds.StudyDate = f"{date_from}-{date_to}"
+
+        series_by_study: Dict[str, List[DicomSeries]] = {}
+
+        assoc = None
+        try:
+            assoc = self._associate(node, self._relational_ae, ext_neg=[self._relational_item])
+            if not assoc.is_established:
+                return None
+
+            app_info = assoc.acceptor.sop_class_extended.get(StudyRootQueryRetrieveInformationModelFind)
+            if not app_info or app_info[0] != 1:
+                # Relational queries not accepted: fall back to one query per study from now on
+                self._relational_unsupported.add(node_key)
+                self._release(assoc)
+                return None
+
+            responses = assoc.send_c_find(ds, StudyRootQueryRetrieveInformationModelFind)
+            for (status, identifier) in responses:
+                if not status:
+                    self._discard(assoc)
+                    return None  # Incomplete result, the caller queries per study
+                if status.Status not in PENDING_STATUSES:
+                    if status.Status != 0x0000:
+                        self._release(assoc)
+                        return None
+                    break
+                if identifier:
+                    (series_uid, series_number, num_images, modality, series_description,
+                     study_uid) = identifier_strings(identifier, SERIES_RESULT_TAGS)
+                    series = DicomSeries(
+                        series_uid=series_uid,
+                        series_number=series_number,
+                        num_images=parse_count(num_images),
+                        modality=modality,
+                        series_description=series_description
+                    )
+                    series_by_study.setdefault(study_uid, []).append(series)
+
+            self._release(assoc)
+
+        except Exception as e:
+            self._discard(assoc)
+            print(f"Error querying series of {node.name}: {e}")
+            return None
+
+        return series_by_study
+
+    def query_images(self, node: DicomNode, study_uid: str, series_uid: str,
+                     expected_count: Optional[int] = None) -> List[str]:
         """
         Query all image SOPInstanceUIDs for a specific series.
 
@@ -556,22 +1235,31 @@ class DicomQueryClient:
             node: DicomNode to query
             study_uid: Study Instance UID
             series_uid: Series Instance UID
+            expected_count: Image count of the series from the series query. If given,
+                a list of exactly this length from the last IMAGE_LIST_CACHE_TTL seconds
+                is reused instead of querying again (e.g. when a partial transfer is retried)
 
         Returns:
             List of SOPInstanceUIDs
         """
-        # Create the C-FIND query dataset for image level
-        ds = Dataset()
-        ds.QueryRetrieveLevel = 'IMAGE'
+        cache_key = (node.ip_address, node.port, node.ae_title, series_uid)
+        if expected_count is not None:
+            cached = self._image_cache.get(cache_key)
+            if (cached is not None and len(cached[1]) == expected_count
+                    and time.monotonic() - cached[0] < IMAGE_LIST_CACHE_TTL):
+                return list(cached[1])
+
+        # Create the C-FIND query dataset for image level from the prebuilt template
+        ds = Dataset(dict(self._image_find_template))
         ds.StudyInstanceUID = study_uid
         ds.SeriesInstanceUID = series_uid
-        ds.SOPInstanceUID = ''
 
         image_uids = []
 
+        assoc = None
         try:
             # Associate with peer AE
-            assoc = self.ae.associate(node.ip_address, node.port, ae_title=node.ae_title)
+            assoc = self._associate(node)
 
             if assoc.is_established:
                 # Send the C-FIND request
@@ -579,19 +1267,27 @@ class DicomQueryClient:
 
                 for (status, identifier) in responses:
                     if status:
-                        if status.Status in (0xFF00, 0xFF01):
+                        if status.Status in PENDING_STATUSES:
                             if identifier:
-                                sop_uid = str(identifier.get('SOPInstanceUID', ''))
+                                sop_uid, = identifier_strings(identifier, (SOP_INSTANCE_UID_TAG,))
                                 if sop_uid:
                                     image_uids.append(sop_uid)
                         else:
                             break
 
-                assoc.release()
+                self._release(assoc)
 
         except Exception as e:
+            self._discard(assoc)
             print(f"Error querying images: {e}")
 
+        if expected_count is not None and len(image_uids) == expected_count:
+            now = time.monotonic()
+            # Drop expired lists so the cache does not grow over a long run
+            self._image_cache = {key: entry for key, entry in self._image_cache.items()
+                                 if now - entry[0] < IMAGE_LIST_CACHE_TTL}
+            self._image_cache[cache_key] = (now, tuple(image_uids))
+
         return image_uids
 
     def move_series(self, source_node: DicomNode, dest_ae_title: str, dest_ip: str,
@@ -610,71 +1306,178 @@ class DicomQueryClient:
         Returns:
             True if successful, False otherwise
         """
+        status = None
+        for status, _, _, _, _ in self.move_series_iter(source_node, dest_ae_title, dest_ip,
+                                                        dest_port, study_uid, series_uid):
+            pass
+        return status == 0x0000
+
+    def move_series_iter(self, source_node: DicomNode, dest_ae_title: str, dest_ip: str,
+                         dest_port: int, study_uid: str, series_uid: str) -> Iterator[tuple]:
+        """
+        Move a series using C-MOVE and yield the progress of each C-MOVE response.
+
+        Args:
+            source_node: Source DICOM node
+            dest_ae_title: Destination AE title (how source knows us)
+            dest_ip: Destination IP address (how source knows us)
+            dest_port: Destination port (how source knows us)
+            study_uid: Study Instance UID
+            series_uid: Series Instance UID
+
+        Returns:
+            Iterator of (status, remaining, completed, failed, warning) tuples with the
+            sub-operation counts of each response; the last status is 0x0000 on success.
+            Yields nothing if the association or the request fails.
+        """
         # Create the C-MOVE query dataset
-        ds = Dataset()
-        ds.QueryRetrieveLevel = 'SERIES'
+        ds = Dataset(dict(self._series_retrieve_template))
         ds.StudyInstanceUID = study_uid
         ds.SeriesInstanceUID = series_uid
+        return self._move_iter(source_node, dest_ae_title, dest_ip, dest_port, ds)
 
-        try:
-            # Create a new AE for this specific C-MOVE with the node's transfer syntax
-            move_ae = AE(ae_title=self.calling_ae_title)
+    def move_study_iter(self, source_node: DicomNode, dest_ae_title: str, dest_ip: str,
+                        dest_port: int, study_uid: str) -> Iterator[tuple]:
+        """
+        Move a whole study using one STUDY-level C-MOVE, like move_series_iter().
+
+        Args:
+            source_node: Source DICOM node
+            dest_ae_title: Destination AE title (how source knows us)
+            dest_ip: Destination IP address (how source knows us)
+            dest_port: Destination port (how source knows us)
+            study_uid: Study Instance UID
 
-            # Add the node-specific transfer syntax as preferred
-            transfer_syntax_uid = get_transfer_syntax_uid(source_node.transfer_syntax)
+        Returns:
+            Iterator of (status, remaining, completed, failed, warning) tuples
+        """
+        ds = Dataset(dict(self._study_retrieve_template))
+        ds.StudyInstanceUID = study_uid
+        return self._move_iter(source_node, dest_ae_title, dest_ip, dest_port, ds)
 
-            # Add presentation contexts with multiple transfer syntaxes for better compatibility
-            # Primary: node-specific syntax
-            move_ae.add_requested_context(StudyRootQueryRetrieveInformationModelMove, [
-                transfer_syntax_uid,
-                ImplicitVRLittleEndian  # Always add as fallback
-            ])
+    def _move_iter(self, source_node: DicomNode, dest_ae_title: str, dest_ip: str,
+                   dest_port: int, ds: Dataset) -> Iterator[tuple]:
+        """Send a C-MOVE request and yield the status and sub-operation counts of each response"""
+        assoc = None
+        try:
+            # Reuse the C-MOVE AE prepared for the node's transfer syntax
+            move_ae = self._get_move_ae(source_node.transfer_syntax)
 
             print(f"  Transfer syntax: {source_node.transfer_syntax}")
             print(f"  C-MOVE destination: {dest_ae_title}@{dest_ip}:{dest_port}")
 
             # Associate with peer AE
-            assoc = move_ae.associate(source_node.ip_address, source_node.port,
-                                     ae_title=source_node.ae_title)
+            assoc = self._associate(source_node, move_ae)
 
             if assoc.is_established:
                 # Send the C-MOVE request
                 responses = assoc.send_c_move(ds, dest_ae_title, StudyRootQueryRetrieveInformationModelMove)
 
-                # Track if we received a final success status
-                success = False
-
                 # Consume ALL responses to ensure C-MOVE completes
                 for (status, identifier) in responses:
                     if status:
-                        # Pending status
-                        if status.Status == 0xFF00:
-                            continue
-                        # Success status
-                        elif status.Status == 0x0000:
-                            success = True
-                            # Continue to consume remaining responses
-                            continue
-                        else:
+                        yield (status.Status,
+                               status.get('NumberOfRemainingSuboperations') or 0,
+                               status.get('NumberOfCompletedSuboperations') or 0,
+                               status.get('NumberOfFailedSuboperations') or 0,
+                               status.get('NumberOfWarningSuboperations') or 0)
+                        # Pending or success status: continue to consume remaining responses
+                        if status.Status not in (0xFF00, 0x0000):
                             # Failed or warning
                             print(f"  C-MOVE failed with status: 0x{status.Status:04X}")
                             if hasattr(status, 'ErrorComment'):
                                 print(f"  Error comment: {status.ErrorComment}")
-                            return False
+                            break
 
-                assoc.release()
-                return success
+                self._release(assoc)
             else:
                 print(f"  Association rejected or failed to {source_node.name}")
                 print(f"  Rejection reason: {assoc.rejected if hasattr(assoc, 'rejected') else 'Unknown'}")
-                return False
 
         except Exception as e:
+            self._discard(assoc)
             print(f"  Exception during C-MOVE: {e}")
             import traceback
             traceback.print_exc()
+
+    def _handle_get_store(self, event):
+        """Collect an instance received over a C-GET association for the calling thread"""
+        ds = event.dataset
+        ds.file_meta = event.file_meta
+        self._thread_state.received.append(ds)
+        return 0x0000
+
+    def get_series(self, source_node: DicomNode, dest_node: DicomNode,
+                   study_uid: str, series_uid: str) -> bool:
+        """
+        Retrieve a series using C-GET and store it on the destination node.
+
+        Unlike C-MOVE the instances come back on our own association, so the source
+        does not have to open a connection to us. They are forwarded to dest_node with
+        C-STORE once the retrieval has finished.
+
+        Args:
+            source_node: Source DICOM node (supports_cget set)
+            dest_node: Node to store the retrieved instances on
+            study_uid: Study Instance UID
+            series_uid: Series Instance UID
+
+        Returns:
+            True if successful, False otherwise
+        """
+        # Create the C-GET query dataset
+        ds = Dataset(dict(self._series_retrieve_template))
+        ds.StudyInstanceUID = study_uid
+        ds.SeriesInstanceUID = series_uid
+
+        self._thread_state.received = []
+        assoc = None
+        try:
+            get_ae = self._get_get_ae(source_node.transfer_syntax)
+
+            print(f"  Transfer syntax: {source_node.transfer_syntax}")
+            print(f"  C-GET from {source_node.ae_title}@{source_node.ip_address}:{source_node.port}")
+
+            roles = [build_role(storage_class, scp_role=True) for storage_class in STORAGE_SOP_CLASSES]
+            assoc = self._associate(source_node, get_ae, ext_neg=roles)
+
+            if not assoc.is_established:
+                print(f"  Association rejected or failed to {source_node.name}")
+                return False
+
+            # Intervention handler: binding again on a reused association replaces it
+            assoc.bind(evt.EVT_C_STORE, self._handle_get_store)
+
+            success = False
+            for (status, identifier) in assoc.send_c_get(ds, StudyRootQueryRetrieveInformationModelGet):
+                if status:
+                    if status.Status == 0xFF00:
+                        continue
+                    elif status.Status == 0x0000:
+                        success = True
+                        continue
+                    else:
+                        print(f"  C-GET failed with status: 0x{status.Status:04X}")
+                        if hasattr(status, 'ErrorComment'):
+                            print(f"  Error comment: {status.ErrorComment}")
+                        success = False
+                        break
+
+            self._release(assoc)
+        except Exception as e:
+            self._discard(assoc)
+            print(f"  Exception during C-GET: {e}")
+            return False
+
+        received = self._thread_state.received
+        self._thread_state.received = []
+        if not success:
             return False
 
+        stored = self.store_datasets(dest_node, received)
+        print(f"  Stored {stored}/{len(received)} instances on {dest_node.name}")
+        return stored == len(received)
+
     def move_image(self, source_node: DicomNode, dest_ae_title: str, dest_ip: str,
                    dest_port: int, study_uid: str, series_uid: str, sop_instance_uid: str) -> bool:
         """
@@ -693,27 +1496,18 @@ class DicomQueryClient:
             True if successful, False otherwise
         """
         # Create the C-MOVE query dataset for image level
-        ds = Dataset()
-        ds.QueryRetrieveLevel = 'IMAGE'
+        ds = Dataset(dict(self._image_retrieve_template))
         ds.StudyInstanceUID = study_uid
         ds.SeriesInstanceUID = series_uid
         ds.SOPInstanceUID = sop_instance_uid
 
+        assoc = None
         try:
-            # Create a new AE for this specific C-MOVE
-            move_ae = AE(ae_title=self.calling_ae_title)
-
-            # Add the node-specific transfer syntax
-            transfer_syntax_uid = get_transfer_syntax_uid(source_node.transfer_syntax)
-
-            move_ae.add_requested_context(StudyRootQueryRetrieveInformationModelMove, [
-                transfer_syntax_uid,
-                ImplicitVRLittleEndian
-            ])
+            # Reuse the C-MOVE AE prepared for the node's transfer syntax
+            move_ae = self._get_move_ae(source_node.transfer_syntax)
 
             # Associate with peer AE
-            assoc = move_ae.associate(source_node.ip_address, source_node.port,
-                                     ae_title=source_node.ae_title)
+            assoc = self._associate(source_node, move_ae)
 
             if assoc.is_established:
                 # Send the C-MOVE request
@@ -730,16 +1524,106 @@ class DicomQueryClient:
                             success = True
                             continue
                         else:
-                            return False
+                            success = False
+                            break
 
-                assoc.release()
+                self._release(assoc)
                 return success
             else:
                 return False
 
         except Exception as e:
+            self._discard(assoc)
+            return False
+
+    def store_datasets(self, node: DicomNode, datasets: List[Dataset]) -> int:
+        """
+        Send datasets to a node using C-STORE.
+
+        Args:
+            node: Destination DICOM node
+            datasets: Datasets with file_meta (e.g. read with dcmread)
+
+        Returns:
+            Number of datasets stored successfully
+        """
+        if not datasets:
+            return 0
+
+        # One presentation context per SOP class / transfer syntax pair in this batch
+        store_ae = self._new_ae()
+        contexts = {(ds.SOPClassUID, ds.file_meta.TransferSyntaxUID) for ds in datasets}
+        for sop_class, syntax in list(contexts)[:128]:  # DICOM limit of 128 contexts
+            store_ae.add_requested_context(sop_class, list(dict.fromkeys(
+                [syntax, ExplicitVRLittleEndian, ImplicitVRLittleEndian])))
+
+        stored = 0
+        assoc = None
+        try:
+            assoc = store_ae.associate(node.ip_address, node.port, ae_title=node.ae_title)
+            if not assoc.is_established:
+                print(f"  Association rejected or failed to {node.name}")
+                return 0
+
+            for ds in datasets:
+                status = assoc.send_c_store(ds)
+                if status and status.Status in (0x0000, 0xB000, 0xB007, 0xB006):
+                    stored += 1
+            assoc.release()
+        except Exception as e:
+            self._discard(assoc)
+            print(f"  Exception during C-STORE: {e}")
+
+        return stored
+
+    def retrieve_series_wado(self, source_node: DicomNode, dest_node: DicomNode,
+                             study_uid: str, series_uid: str, timeout: int = 300) -> bool:
+        """
+        Retrieve a series via DICOMweb WADO-RS and store it on the destination node.
+
+        The series is downloaded in one multipart/related response and then sent to
+        dest_node with C-STORE, so no C-MOVE destination has to be configured on the
+        source. The whole series is held in memory while it is forwarded.
+
+        Args:
+            source_node: Source node with wado_rs_url set
+            dest_node: Node to store the retrieved instances on
+            study_uid: Study Instance UID
+            series_uid: Series Instance UID
+            timeout: HTTP timeout in seconds
+
+        Returns:
+            True if all retrieved instances were stored, False otherwise
+        """
+        url = f"{source_node.wado_rs_url.rstrip('/')}/studies/{study_uid}/series/{series_uid}"
+        print(f"  WADO-RS: {url}")
+
+        request = urllib.request.Request(url, headers={
+            'Accept': 'multipart/related; type="application/dicom"; transfer-syntax=*'
+        })
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                content_type = response.headers.get('Content-Type', '')
+                body = response.read()
+        except (urllib.error.URLError, OSError) as e:
+            print(f"  WADO-RS request failed: {e}")
+            return False
+
+        datasets = []
+        for part in split_multipart(body, content_type):
+            try:
+                datasets.append(dcmread(BytesIO(part)))
+            except Exception as e:
+                print(f"  Skipping unreadable WADO-RS part: {e}")
+
+        if not datasets:
+            print("  WADO-RS returned no instances")
             return False
 
+        stored = self.store_datasets(dest_node, datasets)
+        print(f"  Stored {stored}/{len(datasets)} instances on {dest_node.name}")
+        return stored == len(datasets)
+
     def echo_test(self, node: DicomNode, timeout: int = 5) -> bool:
         """
         Test if a DICOM node is reachable using C-ECHO.
@@ -752,14 +1636,10 @@ class DicomQueryClient:
             True if node responds, False otherwise
         """
         try:
-            # Create a temporary AE for echo test
-            echo_ae = AE(ae_title=self.calling_ae_title)
-            echo_ae.add_requested_context(VerificationSOPClass)
-
-            # Set association timeout
-            assoc = echo_ae.associate(node.ip_address, node.port,
-                                     ae_title=node.ae_title,
-                                     max_pdu=16382)
+            # Reuse the client AE, which also requests the Verification context
+            assoc = self.ae.associate(node.ip_address, node.port,
+                                      ae_title=node.ae_title,
+                                      max_pdu=16382)
 
             if assoc.is_established:
                 # Send C-ECHO
@@ -781,7 +1661,8 @@ class DicomStorageSCP:
     Runs in a background thread.
     """
 
-    def __init__(self, ae_title: str, port: int, storage_dir: str):
+    def __init__(self, ae_title: str, port: int, storage_dir: str,
+                 wake_event: Optional[threading.Event] = None, socket_buffer: int = 0):
         """
         Initialize the Storage SCP server.
 
@@ -789,14 +1670,23 @@ class DicomStorageSCP:
             ae_title: AE title for this SCP
             port: Port to listen on
             storage_dir: Directory to store received DICOM files
+            wake_event: Optional event set whenever a file was stored
+            socket_buffer: Receive/send buffer size in bytes for incoming connections (0 = OS default)
         """
         self.ae_title = ae_title
         self.port = port
         self.storage_dir = Path(storage_dir).expanduser()
+        self.wake_event = wake_event
+        self.socket_buffer = socket_buffer
         self.ae = None
-        self.server_thread = None
+        self.server = None
         self.running = False
 
+        # Instances stored per watched (study UID, series UID) since counting_series() started;
+        # waiters are notified on each store
+        self.received_counts: Dict[tuple, int] = {}
+        self.condition = threading.Condition()
+
         # Create storage directory if it doesn't exist
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
@@ -814,12 +1704,78 @@ class DicomStorageSCP:
             # Save the dataset
             ds.save_as(filepath, write_like_original=False)
 
+            # Count it for wait_for_series()
+            key = (str(ds.get('StudyInstanceUID', '')), str(ds.get('SeriesInstanceUID', '')))
+            with self.condition:
+                if key in self.received_counts:
+                    self.received_counts[key] += 1
+                    self.condition.notify_all()
+
+            # Wake up a waiting sync loop
+            if self.wake_event:
+                self.wake_event.set()
+
             # Return success status
             return 0x0000
         except Exception as e:
             print(f"Error storing DICOM file: {e}")
             return 0xC000  # Failure status
 
+    @contextmanager
+    def counting_series(self, study_uid: str, series_uids: List[str]):
+        """
+        Count the stored instances of these series while the block runs.
+
+        Counts start at zero, so a series that is transferred again or only partly
+        is not mistaken for complete, and they are dropped when the block ends.
+
+        Args:
+            study_uid: Study Instance UID
+            series_uids: Series Instance UIDs to count
+        """
+        keys = [(study_uid, series_uid) for series_uid in series_uids]
+        with self.condition:
+            for key in keys:
+                self.received_counts[key] = 0
+        try:
+            yield
+        finally:
+            with self.condition:
+                for key in keys:
+                    self.received_counts.pop(key, None)
+
+    def wait_for_series(self, study_uid: str, series_uid: str, expected_images: int,
+                        timeout: float, idle_timeout: float) -> int:
+        """
+        Block until expected_images instances of a series were stored by this SCP
+        since counting_series() started.
+
+        Args:
+            study_uid: Study Instance UID
+            series_uid: Series Instance UID
+            expected_images: Number of instances to wait for
+            timeout: Maximum time to wait in seconds
+            idle_timeout: Stop waiting early if no instance of the series arrived for this long
+
+        Returns:
+            Number of instances of the series received so far
+        """
+        key = (study_uid, series_uid)
+        deadline = time.monotonic() + timeout
+        with self.condition:
+            count = self.received_counts.get(key, 0)
+            last_change = time.monotonic()
+            while count < expected_images:
+                remaining = min(deadline, last_change + idle_timeout) - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.condition.wait(remaining)
+                new_count = self.received_counts.get(key, 0)
+                if new_count != count:
+                    count = new_count
+                    last_change = time.monotonic()
+        return count
+
     def start(self):
         """Start the SCP server in a background thread"""
         if self.running:
@@ -835,33 +1791,7 @@ class DicomStorageSCP:
         self.ae = AE(ae_title=self.ae_title)
 
         # Add all storage SOP classes (for maximum compatibility)
-        from pynetdicom.sop_class import (
-            CTImageStorage, MRImageStorage, UltrasoundImageStorage,
-            SecondaryCaptureImageStorage, XRayAngiographicImageStorage,
-            XRayRadiofluoroscopicImageStorage, NuclearMedicineImageStorage,
-            PositronEmissionTomographyImageStorage,
-            RTImageStorage, RTDoseStorage, RTStructureSetStorage,
-            DigitalXRayImageStorageForPresentation,
-            DigitalXRayImageStorageForProcessing,
-            ComputedRadiographyImageStorage,
-            EnhancedCTImageStorage, EnhancedMRImageStorage,
-            EnhancedXAImageStorage, EnhancedXRFImageStorage
-        )
-
-        storage_classes = [
-            CTImageStorage, MRImageStorage, UltrasoundImageStorage,
-            SecondaryCaptureImageStorage, XRayAngiographicImageStorage,
-            XRayRadiofluoroscopicImageStorage, NuclearMedicineImageStorage,
-            PositronEmissionTomographyImageStorage,
-            RTImageStorage, RTDoseStorage, RTStructureSetStorage,
-            DigitalXRayImageStorageForPresentation,
-            DigitalXRayImageStorageForProcessing,
-            ComputedRadiographyImageStorage,
-            EnhancedCTImageStorage, EnhancedMRImageStorage,
-            EnhancedXAImageStorage, EnhancedXRFImageStorage
-        ]
-
-        for storage_class in storage_classes:
+        for storage_class in STORAGE_SOP_CLASSES:
             self.ae.add_supported_context(storage_class, [
                 ImplicitVRLittleEndian,
                 ExplicitVRLittleEndian,
@@ -874,31 +1804,22 @@ class DicomStorageSCP:
         # Set event handler for C-STORE
         handlers = [(evt.EVT_C_STORE, self.handle_store)]
 
-        # Start server in background thread
-        self.running = True
-        self.server_thread = threading.Thread(
-            target=self._run_server,
-            args=(handlers,),
-            daemon=True
+        # Start server in background thread (pynetdicom runs the acceptor thread)
+        self.server = self.ae.start_server(
+            ('', self.port),
+            block=False,
+            evt_handlers=handlers
         )
-        self.server_thread.start()
+        if self.socket_buffer:
+            # Accepted connections inherit the buffer sizes of the listening socket
+            self.server.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.socket_buffer)
+            self.server.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.socket_buffer)
+        self.running = True
 
         # Wait a moment for server to start
         time.sleep(1)
         print("  Status: Running")
 
-    def _run_server(self, handlers):
-        """Internal method to run the server"""
-        try:
-            self.ae.start_server(
-                ('', self.port),
-                block=True,
-                evt_handlers=handlers
-            )
-        except Exception as e:
-            print(f"SCP server error: {e}")
-            self.running = False
-
     def stop(self):
         """Stop the SCP server"""
         if not self.running:
@@ -910,9 +1831,6 @@ class DicomStorageSCP:
         if self.ae:
             self.ae.shutdown()
 
-        if self.server_thread and self.server_thread.is_alive():
-            self.server_thread.join(timeout=5)
-
         print("  Status: Stopped")
 
 
@@ -1006,14 +1924,25 @@ class PreferencesManager:
 
 
 
-def get_date_range() -> tuple:
-    """Get today and yesterday in YYYYMMDD format"""
+def get_date_range(hours: Optional[int] = None) -> tuple:
+    """
+    Get yesterday and today in YYYYMMDD format.
+
+    Args:
+        hours: If set and the last N hours all fall on today, the range starts today,
+            so the study C-FIND does not return yesterday's studies only to drop them
+
+    Returns:
+        (date_from, date_to) tuple
+    """
     today = datetime.now()
     yesterday = today - timedelta(days=1)
 
     today_str = today.strftime("%Y%m%d")
     yesterday_str = yesterday.strftime("%Y%m%d")
 
+    if hours is not None and (today - timedelta(hours=hours)).date() == today.date():
+        return today_str, today_str
     return yesterday_str, today_str
 
 
@@ -1044,7 +1973,8 @@ def parse_day_keyword(day_keyword: str) -> tuple:
     return date_str, date_str
 
 
-def is_within_last_hours(study_date: str, study_time: str, hours: int = 3) -> bool:
+def is_within_last_hours(study_date: str, study_time: str, hours: int = 3,
+                         cutoff: Optional[datetime] = None) -> bool:
     """
     Check if a study is within the last N hours.
 
@@ -1052,6 +1982,7 @@ def is_within_last_hours(study_date: str, study_time: str, hours: int = 3) -> bo
         study_date: Study date in YYYYMMDD format
         study_time: Study time in HHMMSS format
         hours: Number of hours to look back (default: 3)
+        cutoff: Precomputed datetime.now() - hours; pass it when checking many studies
 
     Returns:
         True if study is within last N hours, False otherwise
@@ -1059,25 +1990,75 @@ def is_within_last_hours(study_date: str, study_time: str, hours: int = 3) -> bo
     if not study_date or len(study_date) < 8:
         return False
 
+    # Calculate N hours ago
+    if cutoff is None:
+        cutoff = datetime.now() - timedelta(hours=hours)
+
+    # Studies from before the cutoff day are decided without parsing date or time
+    if study_date[:8] < f"{cutoff.year:04d}{cutoff.month:02d}{cutoff.day:02d}":
+        return False
+
     # Parse study time (handle various formats)
     study_time_clean = study_time.replace('.', '').replace(':', '')
     if len(study_time_clean) < 6:
         study_time_clean = study_time_clean.ljust(6, '0')
 
     try:
-        # Create datetime from study date and time
-        study_datetime_str = f"{study_date}{study_time_clean[:6]}"
-        study_datetime = datetime.strptime(study_datetime_str, "%Y%m%d%H%M%S")
+        # Create datetime from study date and time (integer slicing, no strptime)
+        study_datetime = datetime(int(study_date[0:4]), int(study_date[4:6]), int(study_date[6:8]),
+                                  int(study_time_clean[0:2]), int(study_time_clean[2:4]),
+                                  int(study_time_clean[4:6]))
 
-        # Calculate N hours ago
-        hours_ago = datetime.now() - timedelta(hours=hours)
-
-        return study_datetime >= hours_ago
+        return study_datetime >= cutoff
     except (ValueError, TypeError):
         # If parsing fails, exclude the study
         return False
 
 
+def filter_within_last_hours(studies: List[DicomStudy], hours: int = 3) -> List[DicomStudy]:
+    """
+    Filter studies to those within the last N hours.
+
+    Compares fixed-width YYYYMMDDHHMMSS strings against the formatted cutoff, so most
+    studies are decided without building a datetime. Only studies that pass this check
+    are validated with is_within_last_hours().
+
+    Args:
+        studies: Studies to filter
+        hours: Number of hours to look back
+
+    Returns:
+        Studies within the time window, in their original order
+    """
+    cutoff = datetime.now() - timedelta(hours=hours)
+    cutoff_key = cutoff.strftime("%Y%m%d%H%M%S")
+
+    result = []
+    for study in studies:
+        study_time = study.study_time.replace('.', '').replace(':', '')
+        key = study.study_date[:8] + study_time[:6].ljust(6, '0')
+        if len(key) == 14 and key >= cutoff_key and \
+                is_within_last_hours(study.study_date, study.study_time, hours, cutoff=cutoff):
+            result.append(study)
+    return result
+
+
+def iter_missing_studies(remote_studies: Iterable[DicomStudy],
+                         local_studies: Iterable[DicomStudy]) -> Iterator[DicomStudy]:
+    """
+    Yield remote studies that are missing on local, without building a list.
+
+    Args:
+        remote_studies: Studies from remote server
+        local_studies: Studies from local server
+
+    Yields:
+        Studies present on remote but missing on local
+    """
+    local_uids = frozenset(study.study_uid for study in local_studies)
+    return (study for study in remote_studies if study.study_uid not in local_uids)
+
+
 def compare_studies(remote_studies: List[DicomStudy], local_studies: List[DicomStudy]) -> List[DicomStudy]:
     """
     Compare remote and local studies, return studies missing on local.
@@ -1089,17 +2070,18 @@ def compare_studies(remote_studies: List[DicomStudy], local_studies: List[DicomS
     Returns:
         List of studies present on remote but missing on local
     """
-    local_uids = {study.study_uid for study in local_studies}
-    missing_studies = [study for study in remote_studies if study.study_uid not in local_uids]
-
-    return missing_studies
+    return list(iter_missing_studies(remote_studies, local_studies))
 
 
 def compare_series_and_filter(studies: List[DicomStudy], client: DicomQueryClient,
                               remote_node: DicomNode, local_node: DicomNode,
                               stability_tracker: Optional[SeriesStabilityTracker] = None,
                               max_images: Optional[int] = None,
-                              all_series: bool = False) -> List[tuple]:
+                              all_series: bool = False,
+                              max_workers: int = QUERY_WORKERS,
+                              quiet: bool = False,
+                              inventory: Optional[LocalInventory] = None,
+                              date_range: Optional[tuple] = None) -> List[tuple]:
     """
     Query series for each study on both remote and local, then filter incomplete series.
 
@@ -1115,6 +2097,12 @@ def compare_series_and_filter(studies: List[DicomStudy], client: DicomQueryClien
         stability_tracker: Optional tracker to ensure series are stable before transfer
         max_images: If set, transfer all series with up to this many images
         all_series: If True, transfer all series
+        max_workers: Number of studies whose series are queried in parallel
+        quiet: Only print series that are transferred, waiting or skipped by a filter
+        inventory: Optional inventory of complete local series to skip local C-FINDs
+        date_range: (date_from, date_to) of the studies; nodes supporting relational
+            queries are then asked for all series at once instead of per study,
+            otherwise studies with as many local as remote instances are skipped
 
     Returns:
         List of tuples (study, remote_series, local_image_count) for series to transfer
@@ -1127,85 +2115,148 @@ def compare_series_and_filter(studies: List[DicomStudy], client: DicomQueryClien
     else:
         print(f"  Mode: Transfer all incomplete series (default)")
 
-    for i, study in enumerate(studies, 1):
-        print(f"  [{i}/{len(studies)}] Checking series for {study.patient_name} ({study.study_date})...")
-
-        # Query series on remote
-        print(f"      Querying remote server...")
-        remote_series_list = client.query_series(remote_node, study.study_uid)
-        study.series = remote_series_list
-        print(f"      Found {len(remote_series_list)} series on remote")
-
+    # One relational C-FIND per node instead of one series query per study, if supported
+    remote_by_study = local_by_study = None
+    if date_range:
+        remote_by_study = client.query_series_by_date(remote_node, *date_range)
+        if remote_by_study is not None:
+            print(f"  Relational query: {sum(map(len, remote_by_study.values()))} remote series in one C-FIND")
+            local_by_study = client.query_series_by_date(local_node, *date_range)
+        else:
+            # One study-level C-FIND on local instead of two series C-FINDs per synced study.
+            # Only an exact match counts as synced: with more local images (e.g. locally created
+            # presentation states or key objects) a remote series could still be missing.
+            local_study_counts = {local_study.study_uid: local_study.num_images
+                                  for local_study in client.query_studies(local_node, *date_range)}
+            pending = [study for study in studies
+                       if not (study.num_images > 0
+                               and study.num_images == local_study_counts.get(study.study_uid))]
+            if len(pending) < len(studies):
+                print(f"  {len(studies) - len(pending)} studies have the same image count on local - skipping their series queries")
+                studies = pending
+
+    def fetch_series(study: DicomStudy) -> tuple:
+        """(remote series, local series, True if the local series came from the inventory)"""
+        if remote_by_study is not None:
+            remote_series_list = remote_by_study.get(study.study_uid, [])
+        else:
+            remote_series_list = client.query_series(remote_node, study.study_uid)
         if not remote_series_list:
-            continue
-
-        # Query series on local
-        print(f"      Querying local server...")
-        local_series_list = client.query_series(local_node, study.study_uid)
-        local_series_dict = {series.series_uid: series.num_images for series in local_series_list}
-        print(f"      Found {len(local_series_list)} series on local")
+            return remote_series_list, [], False
+        if local_by_study is not None:
+            return remote_series_list, local_by_study.get(study.study_uid, []), False
+        if inventory:
+            local_series_list = inventory.local_series_if_complete(study.study_uid, remote_series_list)
+            if local_series_list is not None:
+                return remote_series_list, local_series_list, True
+        return remote_series_list, client.query_series(local_node, study.study_uid), False
+
+    # Query remote and local series for all studies in parallel (one association per node and worker)
+    print(f"  Querying series ({max_workers} parallel workers)...")
+    with client.persistent_associations():
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            series_results = list(executor.map(fetch_series, studies))
+
+    # Local image counts of all studies in one lookup table
+    local_counts = {(study.study_uid, series.series_uid): series.num_images
+                    for study, (_, local_series_list, _) in zip(studies, series_results)
+                    for series in local_series_list}
+
+    # Report per study instead of per line
+    with buffered_output():
+        for i, (study, (remote_series_list, local_series_list, from_inventory)) in enumerate(
+                zip(studies, series_results), 1):
+            study.series = remote_series_list
+            if not quiet:
+                print(f"  [{i}/{len(studies)}] Checking series for {study.patient_name} ({study.study_date})...")
+                print(f"      Found {len(remote_series_list)} series on remote")
+
+            if not remote_series_list:
+                continue
 
-        # Find incomplete series
-        for series in remote_series_list:
-            local_image_count = local_series_dict.get(series.series_uid, 0)
+            if not quiet:
+                print(f"      Found {len(local_series_list)} series on local")
 
-            # Skip if series is complete
-            if local_image_count >= series.num_images:
-                print(f"      Series {series.series_number}: {series.num_images} images - COMPLETE (skip)")
-                continue
+            # Find incomplete series
+            for series in remote_series_list:
+                local_image_count = local_counts.get((study.study_uid, series.series_uid), 0)
 
-            # Skip if series has no images
-            if series.num_images <= 0:
-                print(f"      Series {series.series_number}: 0 images - EMPTY (skip)")
-                continue
+                # Skip if series is complete
+                if local_image_count >= series.num_images:
+                    # Only a real local C-FIND renews the entry, so it still expires after max_age
+                    if inventory and series.num_images > 0 and not from_inventory:
+                        inventory.record(study.study_uid, series.series_uid, local_image_count)
+                    if not quiet:
+                        print(f"      Series {series.series_number}: {series.num_images} images - COMPLETE (skip)")
+                    continue
 
-            # Calculate missing images
-            missing_images = series.num_images - local_image_count
+                # Skip if series has no images
+                if series.num_images <= 0:
+                    if not quiet:
+                        print(f"      Series {series.series_number}: 0 images - EMPTY (skip)")
+                    continue
 
-            # CRITICAL: Skip if only 1-3 images are missing from larger series (>10 images)
-            # Small series (<=10 images) with few missing images are allowed
-            # BUT: Only apply this filter if NOT in all_series mode and max_images is None
-            if missing_images <= 3 and series.num_images > 10 and not all_series and max_images is None:
-                print(f"      Series {series.series_number}: {series.num_images} images ({local_image_count} local) - SKIP (only {missing_images} images missing, series > 10 images)")
-                continue
+                # Calculate missing images
+                missing_images = series.num_images - local_image_count
 
-            # Check series stability if tracker is enabled
-            if stability_tracker:
-                is_stable = stability_tracker.update_series(
-                    remote_node.name, study.study_uid, series.series_uid, series.num_images
-                )
-                if not is_stable:
-                    print(f"      Series {series.series_number}: {series.num_images} images ({local_image_count} local) - WAIT (series not yet stable, checking again next cycle)")
+                # CRITICAL: Skip if only 1-3 images are missing from larger series (>10 images)
+                # Small series (<=10 images) with few missing images are allowed
+                # BUT: Only apply this filter if NOT in all_series mode and max_images is None
+                if missing_images <= 3 and series.num_images > 10 and not all_series and max_images is None:
+                    print(f"      Series {series.series_number}: {series.num_images} images ({local_image_count} local) - SKIP (only {missing_images} images missing, series > 10 images)")
                     continue
 
-            # Apply filtering based on selection criteria
-            should_transfer = False
-            reason = ""
+                # Check series stability if tracker is enabled
+                if stability_tracker:
+                    is_stable = stability_tracker.update_series(
+                        remote_node.name, study.study_uid, series.series_uid, series.num_images
+                    )
+                    if not is_stable:
+                        print(f"      Series {series.series_number}: {series.num_images} images ({local_image_count} local) - WAIT (series not yet stable, checking again next cycle)")
+                        continue
 
-            if max_images is not None:
-                # Transfer series with up to N images
-                should_transfer = series.num_images <= max_images
-                if should_transfer:
-                    reason = f"has {series.num_images} ≤ {max_images} images ({missing_images} missing)"
+                # Apply filtering based on selection criteria
+                should_transfer = False
+                reason = ""
+
+                if max_images is not None:
+                    # Transfer series with up to N images
+                    should_transfer = series.num_images <= max_images
+                    if should_transfer:
+                        reason = f"has {series.num_images} ≤ {max_images} images ({missing_images} missing)"
+                    else:
+                        reason = f"has {series.num_images} > {max_images} images"
                 else:
-                    reason = f"has {series.num_images} > {max_images} images"
-            else:
-                # Default mode: transfer all incomplete series (like --all-series)
-                should_transfer = True
-                reason = f"incomplete ({missing_images} images missing)"
+                    # Default mode: transfer all incomplete series (like --all-series)
+                    should_transfer = True
+                    reason = f"incomplete ({missing_images} images missing)"
 
-            status = "→ TRANSFER" if should_transfer else "SKIP"
-            print(f"      Series {series.series_number}: {series.num_images} images ({local_image_count} local) - {status} ({reason})")
+                status = "→ TRANSFER" if should_transfer else "SKIP"
+                print(f"      Series {series.series_number}: {series.num_images} images ({local_image_count} local) - {status} ({reason})")
 
-            if should_transfer:
-                transfer_list.append((study, series, local_image_count))
+                if should_transfer:
+                    transfer_list.append((study, series, local_image_count))
+
+            sys.stdout.flush()
 
     return transfer_list
 
 
+def counting_arrivals(study_uid: str, series_uids: List[str]):
+    """
+    Count the instances of these series that arrive at our own Storage SCP while the block runs.
+
+    Enter it before the transfer starts; does nothing if the SCP is not running.
+    """
+    if _scp_server is not None and _scp_server.running:
+        return _scp_server.counting_series(study_uid, series_uids)
+    return nullcontext()
+
+
 def wait_for_series_completion(client: DicomQueryClient, local_node: DicomNode,
                                study_uid: str, series_uid: str, expected_images: int,
-                               timeout: int = 60, check_interval: float = 1.5) -> bool:
+                               timeout: int = 60, check_interval: float = 1.5,
+                               moved_images: Optional[int] = None) -> bool:
     """
     Wait for a series to complete transfer by monitoring the local server.
 
@@ -1217,17 +2268,38 @@ def wait_for_series_completion(client: DicomQueryClient, local_node: DicomNode,
         expected_images: Expected number of images
         timeout: Maximum time to wait in seconds
         check_interval: Time between checks in seconds
+        moved_images: Number of images the transfer sends (default: expected_images);
+            waited for when our own Storage SCP counts the arrivals (see counting_arrivals())
 
     Returns:
         True if series completed successfully, False if timeout
     """
-    start_time = time.time()
+    if _scp_server is not None and _scp_server.running:
+        # Images arrive at our own Storage SCP: wait for its store notifications instead of polling
+        idle_timeout = 3 * check_interval
+        if moved_images is None:
+            moved_images = expected_images
+        current_count = _scp_server.wait_for_series(study_uid, series_uid, moved_images,
+                                                    timeout, idle_timeout)
+        if current_count >= moved_images:
+            print(f"    ✓ Series complete: {current_count}/{moved_images} images arrived")
+            return True
+        if current_count > 0:
+            print(f"    ⚠ Transfer may be incomplete: {current_count}/{moved_images} images (no new images for {idle_timeout:.1f}s)")
+            return True  # Accept partial transfer
+        print(f"    ✗ No images arrived after {idle_timeout:.1f}s - transfer failed")
+        return False
+
+    start_time = time.monotonic()
     last_count = 0
-    stable_count = 0
+    last_change = start_time
+    idle_timeout = 3 * check_interval
+    # Poll quickly first (images usually arrive right after the C-MOVE), then back off to check_interval
+    interval = min(0.1, check_interval)
 
-    while time.time() - start_time < timeout:
-        # Query local server for this series
-        series_list = client.query_series(local_node, study_uid)
+    while time.monotonic() - start_time < timeout:
+        # Query local server for this series only (not all series of the study)
+        series_list = client.query_series(local_node, study_uid, series_uid)
 
         # Find our specific series
         current_count = 0
@@ -1241,111 +2313,174 @@ def wait_for_series_completion(client: DicomQueryClient, local_node: DicomNode,
             print(f"    ✓ Series complete: {current_count}/{expected_images} images arrived")
             return True
 
+        now = time.monotonic()
         # Check if count is stable (no new images arriving)
         if current_count == last_count:
-            stable_count += 1
-            # If count hasn't changed for 3 checks (4.5 seconds), consider it done
-            if stable_count >= 3:
+            # If count hasn't changed for 3 check intervals (4.5 seconds), consider it done
+            if now - last_change >= idle_timeout:
                 if current_count > 0:
-                    print(f"    ⚠ Transfer may be incomplete: {current_count}/{expected_images} images (no new images for {stable_count * check_interval:.1f}s)")
+                    print(f"    ⚠ Transfer may be incomplete: {current_count}/{expected_images} images (no new images for {now - last_change:.1f}s)")
                     return True  # Accept partial transfer
                 else:
                     # No images arrived at all - likely a failed transfer
-                    print(f"    ✗ No images arrived after {stable_count * check_interval:.1f}s - transfer failed")
+                    print(f"    ✗ No images arrived after {now - last_change:.1f}s - transfer failed")
                     return False
+            interval = min(interval * 1.7, check_interval)
         else:
-            # Count changed, reset stable counter
-            stable_count = 0
+            # Count changed, restart the idle time and poll quickly again
+            last_change = now
+            interval = min(0.1, check_interval)
             print(f"    → Receiving: {current_count}/{expected_images} images...")
+            sys.stdout.flush()
 
         last_count = current_count
-        time.sleep(check_interval)
+        # Jitter keeps the polls of parallel transfers from hitting the local PACS in lockstep
+        time.sleep(interval * random.uniform(0.8, 1.2))
 
     # Timeout reached
     print(f"    ✗ Timeout after {timeout}s: {last_count}/{expected_images} images")
     return False
 
 
-def transfer_series_sequential(transfer_list: List[tuple], client: DicomQueryClient,
-                               remote_node: DicomNode, local_ae_title: str,
-                               local_ip: str, local_port: int,
-                               local_node: DicomNode,
-                               stability_tracker: Optional[SeriesStabilityTracker] = None,
-                               use_image_level: bool = False) -> int:
+class TransferProgress:
+    """Counters for a batch of series transfers, safe to update from worker threads"""
+
+    def __init__(self, total_series: int, total_images: int):
+        self.total_series = total_series
+        self.total_images = total_images
+        self.transferred_series = 0
+        self.transferred_images = 0
+        self.failed_series = 0
+        self.start_time = time.monotonic()
+        self.lock = threading.Lock()
+
+    def record(self, success: bool, num_images: int) -> float:
+        """Record a finished series and return the running average speed in img/s"""
+        with self.lock:
+            if success:
+                self.transferred_series += 1
+                self.transferred_images += num_images
+            else:
+                self.failed_series += 1
+            elapsed_time = time.monotonic() - self.start_time
+            return self.transferred_images / elapsed_time if elapsed_time > 0 else 0
+
+    def print_statistics(self):
+        """Print the final transfer statistics"""
+        total_time = time.monotonic() - self.start_time
+        final_rate_per_second = self.transferred_images / total_time if total_time > 0 else 0
+        final_rate_per_minute = final_rate_per_second * 60
+
+        print(f"{'=' * 120}")
+        print(f"Transfer statistics:")
+        print(f"  Successfully transferred: {self.transferred_series}/{self.total_series} series ({self.transferred_images} images)")
+        if self.failed_series > 0:
+            print(f"  Failed: {self.failed_series} series")
+        print(f"  Total time: {total_time:.1f} seconds ({total_time/60:.1f} minutes)")
+        print(f"  Average transfer rate: {final_rate_per_second:.1f} images/second ({final_rate_per_minute:.1f} images/minute)")
+
+
+def order_transfer_list(transfer_list: List[tuple], order: str = "given") -> List[tuple]:
     """
-    Transfer series sequentially (one at a time) with detailed status output and live speed tracking.
+    Sort the transfer list by series size.
 
     Args:
-        transfer_list: List of (study, series, local_image_count) tuples to transfer
-        client: DICOM query client
-        remote_node: Remote node (source)
-        local_ae_title: Local AE title (how remote knows us)
-        local_ip: Local IP address (how remote knows us)
-        local_port: Local port (how remote knows us)
-        local_node: Local node to query for completion
-        stability_tracker: Optional tracker to mark series as transferred
-        use_image_level: If True, use IMAGE-level C-MOVE for partial series
+        transfer_list: List of (study, series, local_image_count) tuples
+        order: "given" (analysis order), "small-first" or "large-first"
 
     Returns:
-        Number of images transferred
+        Transfer list in the requested order
     """
-    if not transfer_list:
-        print("\nNo series to transfer")
-        return 0
-
-    total_series = len(transfer_list)
-    total_images = sum(series.num_images for _, series, _ in transfer_list)
+    if order == "small-first":
+        return sorted(transfer_list, key=lambda item: item[1].num_images)
+    if order == "large-first":
+        return sorted(transfer_list, key=lambda item: item[1].num_images, reverse=True)
+    return transfer_list
 
-    transferred_series = 0
-    transferred_images = 0
-    failed_series = 0
 
-    overall_start_time = time.time()
+def print_transfer_plan(transfer_list: List[tuple]) -> int:
+    """
+    Print the series that would be transferred, without transferring them (--dry-run).
 
-    print(f"\nStarting transfer: {total_series} series, {total_images} images")
-    print(f"{'=' * 120}\n")
+    Args:
+        transfer_list: List of (study, series, local_image_count) tuples
 
+    Returns:
+        Number of images that would be transferred
+    """
+    total_images = sum(series.num_images for _, series, _ in transfer_list)
+    rows = [f"\nDRY RUN - would transfer {len(transfer_list)} series, {total_images} images:"]
     for i, (study, series, local_count) in enumerate(transfer_list, 1):
-        # Format study information
-        date_formatted = f"{study.study_date[:4]}-{study.study_date[4:6]}-{study.study_date[6:8]}" if len(study.study_date) == 8 else study.study_date
-        timestamp = datetime.now().strftime("%H:%M:%S")
-
-        # Show completeness status
         if local_count == 0:
             status_info = f"New series ({series.num_images} img)"
         else:
             status_info = f"Incomplete ({local_count}/{series.num_images} img)"
+        rows.append(f"  [{i}/{len(transfer_list)}] {study.patient_name} | {study.date_formatted} | "
+                    f"Series {series.series_number} ({series.modality}) - {status_info} | "
+                    f"{series.series_description[:60]}")
+    sys.stdout.write("\n".join(rows) + "\n")
+    return total_images
+
+
+def transfer_one_series(i: int, study: DicomStudy, series: DicomSeries, local_count: int,
+                        progress: TransferProgress, client: DicomQueryClient,
+                        remote_node: DicomNode, local_ae_title: str,
+                        local_ip: str, local_port: int,
+                        local_node: DicomNode,
+                        stability_tracker: Optional[SeriesStabilityTracker] = None,
+                        use_image_level: bool = False,
+                        image_workers: int = IMAGE_MOVE_WORKERS) -> bool:
+    """
+    Transfer one series with status output, then wait for its images to arrive.
 
-        # Print C-MOVE info with timestamp
-        print(f"[{timestamp}] [{i}/{total_series}] C-MOVE START")
-        print(f"  Patient: {study.patient_name}")
-        print(f"  Date: {date_formatted}")
-        print(f"  Series: {series.series_number} ({series.modality}) - {status_info}")
-        print(f"  Description: {series.series_description[:60]}")
-
-        # Track series transfer time
-        series_start_time = time.time()
-
-        # Determine transfer strategy: IMAGE-level for partial series, SERIES-level for new/mostly missing
-        missing_images = series.num_images - local_count
-        use_image_transfer = False
+    Missing images of a partial series are moved with up to image_workers
+    IMAGE-level C-MOVEs at the same time.
 
-        if use_image_level and local_count > 0:
-            # Calculate percentage of missing images
-            missing_percentage = missing_images / series.num_images
+    Returns:
+        True if the C-MOVE succeeded, False otherwise
+    """
+    timestamp = clock_time()
 
-            # Use IMAGE-level if less than 30% is missing
-            if missing_percentage < 0.3:
-                use_image_transfer = True
-                print(f"  Strategy: IMAGE-level (only {missing_images} of {series.num_images} images missing, {missing_percentage*100:.1f}%)")
-            else:
-                print(f"  Strategy: SERIES-level ({missing_images} of {series.num_images} images missing, {missing_percentage*100:.1f}%)")
+    # Show completeness status
+    if local_count == 0:
+        status_info = f"New series ({series.num_images} img)"
+    else:
+        status_info = f"Incomplete ({local_count}/{series.num_images} img)"
+
+    # Print C-MOVE info with timestamp
+    sys.stdout.write(TRANSFER_HEADER_FORMAT % (
+        timestamp, i, progress.total_series, study.patient_name, study.date_formatted,
+        series.series_number, series.modality, status_info, series.series_description))
+    sys.stdout.flush()  # Show the header while the transfer is running
+
+    # Track series transfer time
+    series_start_time = time.monotonic()
+
+    # Determine transfer strategy: IMAGE-level for partial series, SERIES-level for new/mostly missing
+    missing_images = series.num_images - local_count
+    use_image_transfer = False
+    confirmed = False  # Set when the C-MOVE responses confirm that every image was stored
+    moved_images = series.num_images  # Images the transfer sends to us
+
+    if use_image_level and local_count > 0 and not (remote_node.wado_rs_url or remote_node.supports_cget):
+        # Calculate percentage of missing images
+        missing_percentage = missing_images / series.num_images
+
+        # Use IMAGE-level if less than 30% is missing
+        if missing_percentage < 0.3:
+            use_image_transfer = True
+            print(f"  Strategy: IMAGE-level (only {missing_images} of {series.num_images} images missing, {missing_percentage*100:.1f}%)")
+        else:
+            print(f"  Strategy: SERIES-level ({missing_images} of {series.num_images} images missing, {missing_percentage*100:.1f}%)")
 
+    # Count arrivals from the start, so the wait below does not see images of earlier transfers
+    with counting_arrivals(study.study_uid, [series.series_uid]):
         # Perform the transfer
         if use_image_transfer:
             # IMAGE-level transfer: Query which images exist, transfer only missing ones
             print(f"  Querying remote for image list...")
-            remote_image_uids = client.query_images(remote_node, study.study_uid, series.series_uid)
+            remote_image_uids = client.query_images(remote_node, study.study_uid, series.series_uid,
+                                                    expected_count=series.num_images)
             print(f"  Found {len(remote_image_uids)} images on remote")
 
             print(f"  Querying local for image list...")
@@ -1355,36 +2490,55 @@ def transfer_series_sequential(transfer_list: List[tuple], client: DicomQueryCli
 
             # Find missing images
             missing_image_uids = [uid for uid in remote_image_uids if uid not in local_image_uid_set]
+            moved_images = len(missing_image_uids)
             print(f"  Transferring {len(missing_image_uids)} missing images...")
 
+            # Several single-image C-MOVEs in flight, each worker on its own association.
+            # The nested block releases the workers' associations once the series is done.
             success_count = 0
-            for j, image_uid in enumerate(missing_image_uids, 1):
-                if j % 10 == 0 or j == len(missing_image_uids):
-                    print(f"    Progress: {j}/{len(missing_image_uids)} images")
-
-                img_success = client.move_image(remote_node, local_ae_title, local_ip, local_port,
-                                               study.study_uid, series.series_uid, image_uid)
-                if img_success:
-                    success_count += 1
+            with client.persistent_associations():
+                with ThreadPoolExecutor(max_workers=image_workers) as executor:
+                    futures = [executor.submit(client.move_image, remote_node, local_ae_title, local_ip,
+                                               local_port, study.study_uid, series.series_uid, image_uid)
+                               for image_uid in missing_image_uids]
+                    for j, future in enumerate(as_completed(futures), 1):
+                        if future.result():
+                            success_count += 1
+                        if j % 10 == 0 or j == len(missing_image_uids):
+                            print(f"    Progress: {j}/{len(missing_image_uids)} images")
 
             success = success_count == len(missing_image_uids)
             if success:
                 print(f"  ✓ All {len(missing_image_uids)} images transferred successfully")
             else:
                 print(f"  ⚠ Only {success_count}/{len(missing_image_uids)} images transferred")
+        elif remote_node.wado_rs_url:
+            # DICOMweb transfer: Retrieve entire series over HTTP and store it locally
+            success = client.retrieve_series_wado(remote_node, local_node,
+                                                  study.study_uid, series.series_uid)
+        elif remote_node.supports_cget:
+            # C-GET transfer: Instances come back on our association and are stored locally
+            success = client.get_series(remote_node, local_node, study.study_uid, series.series_uid)
         else:
-            # SERIES-level transfer: Transfer entire series
-            success = client.move_series(remote_node, local_ae_title, local_ip, local_port,
-                                         study.study_uid, series.series_uid)
-
-        series_end_time = time.time()
+            # SERIES-level transfer: Transfer entire series, following the C-MOVE progress
+            status = None
+            reported = 0
+            for status, _, completed, failed, _ in client.move_series_iter(
+                    remote_node, local_ae_title, local_ip, local_port, study.study_uid, series.series_uid):
+                if status == 0xFF00 and completed // 10 > reported // 10:
+                    print(f"    Progress: {completed}/{series.num_images} images")
+                    reported = completed
+            success = status == 0x0000
+            # The destination acknowledged every C-STORE: no need to watch for the images
+            confirmed = success and not failed and completed >= series.num_images
+
+        series_end_time = time.monotonic()
         series_duration = series_end_time - series_start_time
-        end_timestamp = datetime.now().strftime("%H:%M:%S")
+        end_timestamp = clock_time()
 
-        if success:
-            transferred_series += 1
-            transferred_images += series.num_images
+        avg_speed = progress.record(success, series.num_images)
 
+        if success:
             # Mark series as transferred in stability tracker
             if stability_tracker:
                 stability_tracker.mark_transferred(remote_node.name, study.study_uid, series.series_uid)
@@ -1392,36 +2546,297 @@ def transfer_series_sequential(transfer_list: List[tuple], client: DicomQueryCli
             # Calculate speed for this series
             series_speed = series.num_images / series_duration if series_duration > 0 else 0
 
-            # Calculate running average speed
-            elapsed_time = series_end_time - overall_start_time
-            avg_speed = transferred_images / elapsed_time if elapsed_time > 0 else 0
+            # Status block in one write, flushed so it is visible during the arrival check
+            sys.stdout.write(
+                f"[{end_timestamp}] C-MOVE COMPLETE ✓\n"
+                f"  Speed: {series_speed:.1f} img/s (this series) | Average: {avg_speed:.1f} img/s | Time: {series_duration:.1f}s\n")
+
+            if confirmed:
+                print(f"  ✓ All {series.num_images} images stored (confirmed by C-MOVE response)")
+            else:
+                # Wait for images to actually arrive by monitoring local server
+                sys.stdout.write("  Monitoring local server for image arrival...\n")
+                sys.stdout.flush()
+                wait_for_series_completion(client, local_node, study.study_uid, series.series_uid,
+                                          series.num_images, timeout=60, check_interval=1.5,
+                                          moved_images=moved_images)
+        else:
+            print(f"[{end_timestamp}] C-MOVE FAILED ✗")
+
+    return success
+
+
+def group_study_transfers(transfer_list: List[tuple]) -> List[List[tuple]]:
+    """
+    Group the transfer list into single series and whole new studies.
+
+    Consecutive entries form one group if they are all series of the same study,
+    none of them has local images and together they are every remote series of
+    that study; such a study can be moved with one STUDY-level C-MOVE.
+
+    Args:
+        transfer_list: List of (study, series, local_image_count) tuples
+
+    Returns:
+        List of groups, each a list of one or more transfer list entries
+    """
+    groups = []
+    for item in transfer_list:
+        if groups and groups[-1][0][0] is item[0]:
+            groups[-1].append(item)
+        else:
+            groups.append([item])
+
+    result = []
+    for group in groups:
+        study = group[0][0]
+        if (len(group) > 1 and len(group) == len(study.series)
+                and not any(local_count for _, _, local_count in group)):
+            result.append(group)
+        else:
+            result.extend([item] for item in group)
+    return result
+
+
+def transfer_one_study(i: int, group: List[tuple], progress: TransferProgress,
+                       client: DicomQueryClient, remote_node: DicomNode, local_ae_title: str,
+                       local_ip: str, local_port: int, local_node: DicomNode,
+                       stability_tracker: Optional[SeriesStabilityTracker] = None) -> bool:
+    """
+    Transfer all series of a new study with one STUDY-level C-MOVE, then wait for their images.
+
+    Args:
+        i: Position of the first series in the transfer list
+        group: Transfer list entries of the study (see group_study_transfers())
+
+    Returns:
+        True if the C-MOVE succeeded, False otherwise
+    """
+    study = group[0][0]
+    num_images = sum(series.num_images for _, series, _ in group)
+
+    sys.stdout.write(TRANSFER_HEADER_FORMAT % (
+        clock_time(), i, progress.total_series, study.patient_name, study.date_formatted,
+        f"all {len(group)}", "STUDY", f"New study ({num_images} img)", study.study_description))
+    sys.stdout.flush()  # Show the header while the transfer is running
+
+    study_start_time = time.monotonic()
+
+    with counting_arrivals(study.study_uid, [series.series_uid for _, series, _ in group]):
+        status = None
+        reported = 0
+        for status, _, completed, failed, _ in client.move_study_iter(
+                remote_node, local_ae_title, local_ip, local_port, study.study_uid):
+            if status == 0xFF00 and completed // 10 > reported // 10:
+                print(f"    Progress: {completed}/{num_images} images")
+                reported = completed
+        success = status == 0x0000
+        # The destination acknowledged every C-STORE: no need to watch for the images
+        confirmed = success and not failed and completed >= num_images
+
+        study_duration = time.monotonic() - study_start_time
+        end_timestamp = clock_time()
+
+        for _, series, _ in group:
+            avg_speed = progress.record(success, series.num_images)
+
+        if success:
+            if stability_tracker:
+                for _, series, _ in group:
+                    stability_tracker.mark_transferred(remote_node.name, study.study_uid, series.series_uid)
 
-            print(f"[{end_timestamp}] C-MOVE COMPLETE ✓")
-            print(f"  Speed: {series_speed:.1f} img/s (this series) | Average: {avg_speed:.1f} img/s | Time: {series_duration:.1f}s")
+            study_speed = num_images / study_duration if study_duration > 0 else 0
 
-            # Wait for images to actually arrive by monitoring local server
-            print(f"  Monitoring local server for image arrival...")
-            wait_for_series_completion(client, local_node, study.study_uid, series.series_uid,
-                                      series.num_images, timeout=60, check_interval=1.5)
+            sys.stdout.write(
+                f"[{end_timestamp}] C-MOVE COMPLETE ✓\n"
+                f"  Speed: {study_speed:.1f} img/s (this study) | Average: {avg_speed:.1f} img/s | Time: {study_duration:.1f}s\n")
+
+            if confirmed:
+                print(f"  ✓ All {num_images} images stored (confirmed by C-MOVE response)")
+            else:
+                sys.stdout.write("  Monitoring local server for image arrival...\n")
+                sys.stdout.flush()
+                for _, series, _ in group:
+                    wait_for_series_completion(client, local_node, study.study_uid, series.series_uid,
+                                              series.num_images, timeout=60, check_interval=1.5)
         else:
-            failed_series += 1
             print(f"[{end_timestamp}] C-MOVE FAILED ✗")
 
-        print()  # Empty line between transfers
+    return success
 
-    total_time = time.time() - overall_start_time
-    final_rate_per_second = transferred_images / total_time if total_time > 0 else 0
-    final_rate_per_minute = final_rate_per_second * 60
 
-    print(f"{'=' * 120}")
-    print(f"Transfer statistics:")
-    print(f"  Successfully transferred: {transferred_series}/{total_series} series ({transferred_images} images)")
-    if failed_series > 0:
-        print(f"  Failed: {failed_series} series")
-    print(f"  Total time: {total_time:.1f} seconds ({total_time/60:.1f} minutes)")
-    print(f"  Average transfer rate: {final_rate_per_second:.1f} images/second ({final_rate_per_minute:.1f} images/minute)")
+def transfer_series_sequential(transfer_list: List[tuple], client: DicomQueryClient,
+                               remote_node: DicomNode, local_ae_title: str,
+                               local_ip: str, local_port: int,
+                               local_node: DicomNode,
+                               stability_tracker: Optional[SeriesStabilityTracker] = None,
+                               use_image_level: bool = False,
+                               image_workers: int = IMAGE_MOVE_WORKERS) -> int:
+    """
+    Transfer series sequentially (one at a time) with detailed status output and live speed tracking.
 
-    return transferred_images
+    New studies whose series are all in the list are moved with one STUDY-level C-MOVE.
+
+    Args:
+        transfer_list: List of (study, series, local_image_count) tuples to transfer
+        client: DICOM query client
+        remote_node: Remote node (source)
+        local_ae_title: Local AE title (how remote knows us)
+        local_ip: Local IP address (how remote knows us)
+        local_port: Local port (how remote knows us)
+        local_node: Local node to query for completion
+        stability_tracker: Optional tracker to mark series as transferred
+        use_image_level: If True, use IMAGE-level C-MOVE for partial series
+        image_workers: Concurrent IMAGE-level C-MOVEs for the missing images of a series
+
+    Returns:
+        Number of images transferred
+    """
+    if not transfer_list:
+        print("\nNo series to transfer")
+        return 0
+
+    progress = TransferProgress(len(transfer_list),
+                                sum(series.num_images for _, series, _ in transfer_list))
+
+    print(f"\nStarting transfer: {progress.total_series} series, {progress.total_images} images")
+    print(f"{'=' * 120}\n")
+
+    # Keep one association per node open for all C-MOVEs and completion checks.
+    # Output is written in a few chunks per series instead of once per line.
+    if remote_node.wado_rs_url or remote_node.supports_cget:
+        groups = [[item] for item in transfer_list]
+    else:
+        groups = group_study_transfers(transfer_list)
+
+    with client.persistent_associations(), buffered_output():
+        i = 1
+        for group in groups:
+            if len(group) > 1:
+                transfer_one_study(i, group, progress, client, remote_node, local_ae_title,
+                                   local_ip, local_port, local_node,
+                                   stability_tracker=stability_tracker)
+            else:
+                study, series, local_count = group[0]
+                transfer_one_series(i, study, series, local_count, progress, client, remote_node,
+                                    local_ae_title, local_ip, local_port, local_node,
+                                    stability_tracker=stability_tracker,
+                                    use_image_level=use_image_level,
+                                    image_workers=image_workers)
+            i += len(group)
+            print()  # Empty line between transfers
+            sys.stdout.flush()
+
+    progress.print_statistics()
+
+    return progress.transferred_images
+
+
+class _ThreadBlockWriter:
+    """
+    stdout proxy used during parallel transfers.
+
+    Output of a worker thread inside begin_block()/end_block() is collected and
+    written as one block, so lines of concurrent transfers do not interleave.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is not None:
+            buffer.append(text)
+            return len(text)
+        with self._lock:
+            return self._stream.write(text)
+
+    def flush(self):
+        if getattr(self._local, 'buffer', None) is None:
+            self._stream.flush()
+
+    def begin_block(self):
+        self._local.buffer = []
+
+    def end_block(self):
+        buffer = self._local.buffer
+        self._local.buffer = None
+        with self._lock:
+            self._stream.write(''.join(buffer))
+            self._stream.flush()
+
+
+def transfer_series_parallel(transfer_list: List[tuple], client: DicomQueryClient,
+                             remote_node: DicomNode, local_ae_title: str,
+                             local_ip: str, local_port: int,
+                             local_node: DicomNode,
+                             stability_tracker: Optional[SeriesStabilityTracker] = None,
+                             use_image_level: bool = False,
+                             max_workers: int = TRANSFER_WORKERS) -> int:
+    """
+    Transfer series with several C-MOVEs in flight at once.
+
+    Each worker thread uses its own association to the source node. The status
+    output of a series is printed as one block once that series is done.
+
+    Args:
+        transfer_list: List of (study, series, local_image_count) tuples to transfer
+        client: DICOM query client
+        remote_node: Remote node (source)
+        local_ae_title: Local AE title (how remote knows us)
+        local_ip: Local IP address (how remote knows us)
+        local_port: Local port (how remote knows us)
+        local_node: Local node to query for completion
+        stability_tracker: Optional tracker to mark series as transferred
+        use_image_level: If True, use IMAGE-level C-MOVE for partial series
+        max_workers: Number of concurrent C-MOVE operations
+
+    Returns:
+        Number of images transferred
+    """
+    if not transfer_list:
+        print("\nNo series to transfer")
+        return 0
+
+    progress = TransferProgress(len(transfer_list),
+                                sum(series.num_images for _, series, _ in transfer_list))
+
+    print(f"\nStarting parallel transfer: {progress.total_series} series, {progress.total_images} images "
+          f"({max_workers} concurrent C-MOVEs)")
+    print(f"{'=' * 120}\n")
+
+    writer = _ThreadBlockWriter(sys.stdout)
+
+    def run(item: tuple):
+        i, (study, series, local_count) = item
+        writer.begin_block()
+        try:
+            transfer_one_series(i, study, series, local_count, progress, client, remote_node,
+                                local_ae_title, local_ip, local_port, local_node,
+                                stability_tracker=stability_tracker,
+                                use_image_level=use_image_level,
+                                image_workers=1)  # Series already run in parallel
+            print()  # Empty line between transfers
+        finally:
+            writer.end_block()
+
+    original_stdout = sys.stdout
+    sys.stdout = writer
+    try:
+        with client.persistent_associations():
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(run, enumerate(transfer_list, 1)))
+    finally:
+        sys.stdout = original_stdout
+
+    progress.print_statistics()
+
+    return progress.transferred_images
 
 
 def print_study_table(studies: List[DicomStudy], title: str):
@@ -1434,15 +2849,19 @@ def print_study_table(studies: List[DicomStudy], title: str):
         print("No studies found")
         return
 
-    print(f"{'Study Date':<12} {'Time':<10} {'Patient Name':<25} {'Study Description':<35} {'Images':<8}")
-    print(f"{'-' * 100}")
+    row_format = "{:<12} {:<10} {:<25} {:<35} {:<8}"
+    rows = [row_format.format('Study Date', 'Time', 'Patient Name', 'Study Description', 'Images'),
+            '-' * 100]
 
     for study in studies:
-        date_formatted = f"{study.study_date[:4]}-{study.study_date[4:6]}-{study.study_date[6:8]}" if len(study.study_date) == 8 else study.study_date
-        time_formatted = f"{study.study_time[:2]}:{study.study_time[2:4]}:{study.study_time[4:6]}" if len(study.study_time) >= 6 else study.study_time[:8]
+        study_time = study.study_time
+        time_formatted = f"{study_time[:2]}:{study_time[2:4]}:{study_time[4:6]}" if len(study_time) >= 6 else study_time[:8]
         patient_name = study.patient_name[:22] + "..." if len(study.patient_name) > 25 else study.patient_name
         desc = study.study_description[:32] + "..." if len(study.study_description) > 35 else study.study_description
-        print(f"{date_formatted:<12} {time_formatted:<10} {patient_name:<25} {desc:<35} {study.num_images:<8}")
+        rows.append(row_format.format(study.date_formatted, time_formatted, patient_name, desc, study.num_images))
+
+    # One write for the whole table
+    sys.stdout.write("\n".join(rows) + "\n")
 
 
 def get_series_for_patient(config: DicomConfig, remote_node: DicomNode,
@@ -1524,11 +2943,21 @@ def get_series_for_patient(config: DicomConfig, remote_node: DicomNode,
         print(f"Selected all {len(selected_studies)} studies:")
     print(f"{'=' * 100}")
 
+    def fetch_series(study: DicomStudy) -> tuple:
+        return (client.query_series(remote_node, study.study_uid),
+                client.query_series(local_node, study.study_uid))
+
+    # Query remote and local series of all selected studies in parallel
+    with client.persistent_associations():
+        with ThreadPoolExecutor(max_workers=QUERY_WORKERS) as executor:
+            series_results = list(executor.map(fetch_series,
+                                               (item['study'] for item in selected_studies)))
+
     # Collect all series from selected studies
     transfer_list = []
     total_images = 0
 
-    for study_info in selected_studies:
+    for study_info, (remote_series_list, local_series_list) in zip(selected_studies, series_results):
         study = study_info['study']
         dt = study_info['datetime']
 
@@ -1536,13 +2965,8 @@ def get_series_for_patient(config: DicomConfig, remote_node: DicomNode,
         print(f"  Patient: {study.patient_name}")
         print(f"  Description: {study.study_description}")
 
-        # Query series for this study on remote
-        remote_series_list = client.query_series(remote_node, study.study_uid)
         print(f"  Found {len(remote_series_list)} series on remote")
-
-        # Query series for this study on local
         print(f"  Checking local server...")
-        local_series_list = client.query_series(local_node, study.study_uid)
         local_series_dict = {series.series_uid: series.num_images for series in local_series_list}
         print(f"  Found {len(local_series_list)} series on local")
 
@@ -1593,41 +3017,94 @@ def get_series_for_patient(config: DicomConfig, remote_node: DicomNode,
     return transfer_list
 
 
+def get_move_destination(config: DicomConfig, remote_node: DicomNode) -> tuple:
+    """
+    Determine how the remote node addresses us as C-MOVE destination.
+
+    Args:
+        config: Configuration with the default local node
+        remote_node: Remote node, optionally with its own local_config
+
+    Returns:
+        Tuple (ae_title, ip_address, port)
+    """
+    if remote_node.local_config:
+        return (remote_node.local_config['ae_title'],
+                remote_node.local_config['ip_address'],
+                remote_node.local_config['port'])
+    return config.local_node.ae_title, config.local_node.ip_address, config.local_node.port
+
+
+def print_cycle_end(quiet: bool = False):
+    """Print the end-of-cycle marker (one line in quiet mode)"""
+    cycle_end_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    if quiet:
+        print(f"Sync cycle completed at {cycle_end_time}")
+        return
+    print(f"\n{'=' * 100}")
+    print(f"Sync cycle completed at {cycle_end_time}")
+    print(f"{'=' * 100}")
+
+
 def run_sync_cycle(config: DicomConfig, remote_node: DicomNode, client: DicomQueryClient,
                    stability_tracker: Optional[SeriesStabilityTracker] = None,
                    max_images: Optional[int] = None, all_series: bool = False, hours: int = 3,
-                   download_day: Optional[str] = None, use_image_level: bool = False) -> int:
+                   download_day: Optional[str] = None, use_image_level: bool = False,
+                   transfer_workers: int = 1,
+                   image_workers: int = IMAGE_MOVE_WORKERS,
+                   idle_cache: Optional[IdleStudyCache] = None,
+                   transfer_order: str = "given",
+                   quiet: bool = False,
+                   inventory: Optional[LocalInventory] = None,
+                   move_destination: Optional[tuple] = None,
+                   query_workers: int = QUERY_WORKERS,
+                   dry_run: bool = False) -> int:
     """
     Run a single synchronization cycle
 
+    Args:
+        transfer_workers: Number of concurrent C-MOVEs (1 = sequential transfer)
+        image_workers: Concurrent IMAGE-level C-MOVEs per series in sequential transfers
+        idle_cache: Optional cache to skip the series comparison while nothing changed
+        transfer_order: Order of the transfers, one of TRANSFER_ORDERS
+        quiet: Leave out banners and per-series lines of complete series
+        inventory: Optional inventory of complete local series to skip local C-FINDs
+        move_destination: (ae_title, ip, port) from get_move_destination(); resolved here if None
+        query_workers: Number of studies whose series are queried in parallel
+        dry_run: Only print the series that would be transferred
+
     Returns:
         Number of images transferred in this cycle
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"\n{'=' * 100}")
-    print(f"Starting sync cycle at {current_time}")
-    print(f"{'=' * 100}")
+    if not quiet:
+        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        print(f"\n{'=' * 100}")
+        print(f"Starting sync cycle at {current_time}")
+        print(f"{'=' * 100}")
 
     # Get date range
     if download_day:
         date_from, date_to = parse_day_keyword(download_day)
-        print(f"Searching for ALL studies from day: {date_from}")
+        if not quiet:
+            print(f"Searching for ALL studies from day: {date_from}")
         filter_by_hours = False
     else:
-        date_from, date_to = get_date_range()
-        print(f"Searching for studies from {date_from} to {date_to}")
-        print(f"Filtering studies within last {hours} hours")
+        date_from, date_to = get_date_range(hours)
+        if not quiet:
+            print(f"Searching for studies from {date_from} to {date_to}")
+            print(f"Filtering studies within last {hours} hours")
         filter_by_hours = True
 
     # Query remote server
-    print("\n" + "=" * 80)
-    print("Querying Remote Server")
-    print("=" * 80)
+    if not quiet:
+        print("\n" + "=" * 80)
+        print("Querying Remote Server")
+        print("=" * 80)
     remote_studies_all = client.query_studies(remote_node, date_from, date_to)
 
     # Filter remote studies to last N hours (only if not in download-day mode)
     if filter_by_hours:
-        remote_studies = [s for s in remote_studies_all if is_within_last_hours(s.study_date, s.study_time, hours)]
+        remote_studies = filter_within_last_hours(remote_studies_all, hours)
         print(f"Filtered to {len(remote_studies)} studies within last {hours} hours (from {len(remote_studies_all)} total)")
     else:
         remote_studies = remote_studies_all
@@ -1638,23 +3115,38 @@ def run_sync_cycle(config: DicomConfig, remote_node: DicomNode, client: DicomQue
             print(f"\nNo remote studies found within last {hours} hours")
         else:
             print(f"\nNo remote studies found on {date_from}")
-        cycle_end_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        print(f"\n{'=' * 100}")
-        print(f"Sync cycle completed at {cycle_end_time}")
-        print(f"{'=' * 100}")
+        print_cycle_end(quiet)
+        return 0
+
+    # Nothing changed on the remote since the last cycle in which everything was complete
+    if idle_cache and idle_cache.is_unchanged(remote_studies):
+        print(f"\nRemote studies unchanged since last check ({len(remote_studies)} studies, all complete) - skipping series comparison")
+        print_cycle_end(quiet)
         return 0
 
     # Compare series between remote and local for all remote studies
     # This will check which series are missing on local, regardless of whether the study exists locally
+    failed_queries_before = client.failed_series_queries
     transfer_list = compare_series_and_filter(remote_studies, client, remote_node,
                                              config.local_node, stability_tracker=stability_tracker,
-                                             max_images=max_images, all_series=all_series)
+                                             max_images=max_images, all_series=all_series,
+                                             max_workers=query_workers, quiet=quiet,
+                                             inventory=inventory, date_range=(date_from, date_to))
+
+    if idle_cache:
+        # A failed series query looks like a study without missing series: never remember it as idle
+        if (transfer_list or client.failed_series_queries != failed_queries_before
+                or (stability_tracker and stability_tracker.has_pending(remote_node.name))):
+            idle_cache.clear()
+        else:
+            idle_cache.remember(remote_studies)
 
     # Print results
-    print("\n" + "=" * 80)
-    print("RESULTS SUMMARY")
-    print("=" * 80)
-    print(f"Remote studies found: {len(remote_studies)}")
+    if not quiet:
+        print("\n" + "=" * 80)
+        print("RESULTS SUMMARY")
+        print("=" * 80)
+        print(f"Remote studies found: {len(remote_studies)}")
 
     if transfer_list:
         if max_images is not None:
@@ -1662,32 +3154,40 @@ def run_sync_cycle(config: DicomConfig, remote_node: DicomNode, client: DicomQue
         else:
             print(f"\nFound {len(transfer_list)} series to transfer (all incomplete series)")
 
-        # Determine local config to use (remote-specific or default)
-        if remote_node.local_config:
-            local_ae_title = remote_node.local_config['ae_title']
-            local_ip = remote_node.local_config['ip_address']
-            local_port = remote_node.local_config['port']
-            print(f"\nUsing remote-specific local config: {local_ae_title}@{local_ip}:{local_port}")
+        # Local config to use (remote-specific or default), normally resolved once by main()
+        if move_destination is None:
+            move_destination = get_move_destination(config, remote_node)
+        local_ae_title, local_ip, local_port = move_destination
+        if not quiet:
+            config_kind = "remote-specific" if remote_node.local_config else "default"
+            print(f"\nUsing {config_kind} local config: {local_ae_title}@{local_ip}:{local_port}")
+
+        transfer_list = order_transfer_list(transfer_list, transfer_order)
+
+        # Start transfer automatically
+        if dry_run:
+            print_transfer_plan(transfer_list)
+            transferred_images = 0
+        elif transfer_workers > 1:
+            transferred_images = transfer_series_parallel(transfer_list, client, remote_node,
+                                                          local_ae_title, local_ip, local_port,
+                                                          config.local_node,
+                                                          stability_tracker=stability_tracker,
+                                                          use_image_level=use_image_level,
+                                                          max_workers=transfer_workers)
         else:
-            local_ae_title = config.local_node.ae_title
-            local_ip = config.local_node.ip_address
-            local_port = config.local_node.port
-            print(f"\nUsing default local config: {local_ae_title}@{local_ip}:{local_port}")
-
-        # Start sequential transfer automatically
-        transferred_images = transfer_series_sequential(transfer_list, client, remote_node,
-                                                        local_ae_title, local_ip, local_port,
-                                                        config.local_node,
-                                                        stability_tracker=stability_tracker,
-                                                        use_image_level=use_image_level)
+            transferred_images = transfer_series_sequential(transfer_list, client, remote_node,
+                                                            local_ae_title, local_ip, local_port,
+                                                            config.local_node,
+                                                            stability_tracker=stability_tracker,
+                                                            use_image_level=use_image_level,
+                                                            image_workers=image_workers)
     else:
-        print("\nNo series found to transfer. All relevant series are present on local server!")
+        if not quiet:
+            print("\nNo series found to transfer. All relevant series are present on local server!")
         transferred_images = 0
 
-    cycle_end_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"\n{'=' * 100}")
-    print(f"Sync cycle completed at {cycle_end_time}")
-    print(f"{'=' * 100}")
+    print_cycle_end(quiet)
 
     return transferred_images
 
@@ -1793,8 +3293,102 @@ Examples:
         help='Use IMAGE-level C-MOVE for partial series (transfers only missing images)'
     )
 
+    parser.add_argument(
+        '--parallel-transfers',
+        type=int,
+        default=1,
+        metavar='N',
+        help=f'Run up to N C-MOVE transfers at the same time (default: 1 = sequential, suggested: {TRANSFER_WORKERS})'
+    )
+
+    parser.add_argument(
+        '--parallel-images',
+        type=int,
+        default=IMAGE_MOVE_WORKERS,
+        metavar='N',
+        help='With --image-level: move up to N missing images of a series at the same time '
+             '(default: 1, sequential transfers only)'
+    )
+
+    parser.add_argument(
+        '--parallel-finds',
+        type=int,
+        default=QUERY_WORKERS,
+        metavar='N',
+        help=f'Query the series of up to N studies at the same time (default: {QUERY_WORKERS})'
+    )
+
+    parser.add_argument(
+        '--order',
+        choices=TRANSFER_ORDERS,
+        default='given',
+        help='Order of series transfers: as analyzed (default), smallest series first, or largest first'
+    )
+
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Shorter output per cycle: no banners, no lines for series that are already complete'
+    )
+
+    parser.add_argument(
+        '--socket-buffer',
+        type=int,
+        default=0,
+        metavar='BYTES',
+        help='Socket receive/send buffer size of the built-in Storage SCP (default: 0 = OS autotuning)'
+    )
+
+    parser.add_argument(
+        '--cpu-affinity',
+        type=str,
+        metavar='LIST',
+        help='Pin the process to these CPUs (comma-separated, e.g. "2,3"; Linux only)'
+    )
+
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Query and compare as usual, but only list the series that would be transferred'
+    )
+
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Send at most N requests over one association before opening a new one (default: 0 = no limit)'
+    )
+
+    parser.add_argument(
+        '--debug',
+        action='store_true',
+        help='Log pynetdicom association and DIMSE details (very verbose)'
+    )
+
     args = parser.parse_args()
 
+    if args.debug:
+        enable_network_debugging()
+
+    if args.parallel_finds < 1:
+        parser.error("--parallel-finds must be at least 1")
+    if args.parallel_images < 1:
+        parser.error("--parallel-images must be at least 1")
+    if args.batch_size < 0:
+        parser.error("--batch-size must be 0 (no limit) or more")
+    if args.socket_buffer < 0:
+        parser.error("--socket-buffer must be 0 (OS default) or more")
+
+    if args.cpu_affinity:
+        if not hasattr(os, 'sched_setaffinity'):
+            print("Warning: --cpu-affinity is not supported on this platform, ignoring")
+        else:
+            try:
+                os.sched_setaffinity(0, {int(cpu) for cpu in args.cpu_affinity.split(',')})
+            except (ValueError, OSError) as e:
+                print(f"Warning: Could not set CPU affinity '{args.cpu_affinity}': {e}")
+
     print("=" * 80)
     print("DICOM Automatic Synchronization Tool")
     print("=" * 80)
@@ -1820,6 +3414,23 @@ Examples:
     if args.image_level:
         print("IMAGE-level mode: Enabled (only missing images transferred for partial series)")
 
+    if args.parallel_transfers > 1:
+        print(f"Parallel transfers: {args.parallel_transfers} concurrent C-MOVEs")
+    elif args.image_level and args.parallel_images > 1:
+        print(f"Parallel IMAGE-level moves: {args.parallel_images} concurrent C-MOVEs per series")
+
+    if args.dry_run:
+        print("DRY RUN: Nothing will be transferred")
+
+    if args.parallel_finds != QUERY_WORKERS:
+        print(f"Parallel series queries: {args.parallel_finds}")
+
+    if args.order != 'given':
+        print(f"Transfer order: {args.order}")
+
+    if args.batch_size > 0:
+        print(f"Association batch size: {args.batch_size} requests")
+
     # Load or create configuration
     config = DicomConfig()
 
@@ -1847,8 +3458,24 @@ Examples:
     print(f"  Local:  {config.local_node}")
     print(f"  Remote: {remote_node} (selected: '{args.node}')")
 
+    # How the remote addresses us as C-MOVE destination (does not change between cycles)
+    move_destination = get_move_destination(config, remote_node)
+
+    # Set to end the wait between sync cycles early (e.g. when the built-in SCP receives files)
+    wake_event = threading.Event()
+
+    # SIGHUP: re-read the configuration before the next cycle and start it right away.
+    # The handler only sets a flag: Event.set() could deadlock if the signal interrupts
+    # the main thread while it holds the event's lock in wait().
+    reload_requested = False
+    if hasattr(signal, 'SIGHUP'):
+        def request_reload(signum, frame):
+            nonlocal reload_requested
+            reload_requested = True
+        signal.signal(signal.SIGHUP, request_reload)
+
     # Create query client
-    client = DicomQueryClient()
+    client = DicomQueryClient(max_association_requests=args.batch_size)
 
     # Test if local DICOM node is reachable
     print(f"\nTesting connection to local DICOM node...")
@@ -1873,7 +3500,9 @@ Examples:
         _scp_server = DicomStorageSCP(
             ae_title=config.local_node.ae_title,
             port=config.local_node.port,
-            storage_dir=storage_path
+            storage_dir=storage_path,
+            wake_event=wake_event,
+            socket_buffer=args.socket_buffer
         )
 
         try:
@@ -1892,11 +3521,13 @@ Examples:
 
         print("\nBuilt-in SCP server is now running and ready to receive DICOM files.")
 
-    # Create series stability tracker (only for continuous sync mode)
+    # Create series stability tracker and local inventory (only for continuous sync mode)
     stability_tracker = None
+    inventory = None
     if not args.download_day and not args.patient_id:
         stability_tracker = SeriesStabilityTracker()
         print(f"  Stability tracking: Enabled (prevents transferring incomplete series)")
+        inventory = LocalInventory()
 
     # If patient-id is specified, download series and exit
     if args.patient_id:
@@ -1922,14 +3553,7 @@ Examples:
         max_studies = 1  # Always download last study only
 
         # Determine local config to use
-        if remote_node.local_config:
-            local_ae_title = remote_node.local_config['ae_title']
-            local_ip = remote_node.local_config['ip_address']
-            local_port = remote_node.local_config['port']
-        else:
-            local_ae_title = config.local_node.ae_title
-            local_ip = config.local_node.ip_address
-            local_port = config.local_node.port
+        local_ae_title, local_ip, local_port = move_destination
 
         # Process each patient ID
         total_patients_processed = 0
@@ -1948,12 +3572,25 @@ Examples:
                                                   all_series=args.all_series)
 
             if transfer_list:
+                transfer_list = order_transfer_list(transfer_list, args.order)
+
                 # Transfer the series
-                transfer_series_sequential(transfer_list, client, remote_node,
-                                         local_ae_title, local_ip, local_port,
-                                         config.local_node,
-                                         stability_tracker=None,
-                                         use_image_level=args.image_level)
+                if args.dry_run:
+                    print_transfer_plan(transfer_list)
+                elif args.parallel_transfers > 1:
+                    transfer_series_parallel(transfer_list, client, remote_node,
+                                             local_ae_title, local_ip, local_port,
+                                             config.local_node,
+                                             stability_tracker=None,
+                                             use_image_level=args.image_level,
+                                             max_workers=args.parallel_transfers)
+                else:
+                    transfer_series_sequential(transfer_list, client, remote_node,
+                                             local_ae_title, local_ip, local_port,
+                                             config.local_node,
+                                             stability_tracker=None,
+                                             use_image_level=args.image_level,
+                                             image_workers=args.parallel_images)
                 total_patients_processed += 1
                 total_series_transferred += len(transfer_list)
             else:
@@ -1976,7 +3613,14 @@ Examples:
             run_sync_cycle(config, remote_node, client, stability_tracker=None,
                           max_images=args.max_images, all_series=args.all_series,
                           hours=args.hours, download_day=args.download_day,
-                          use_image_level=args.image_level)
+                          use_image_level=args.image_level,
+                          transfer_workers=args.parallel_transfers,
+                          image_workers=args.parallel_images,
+                          transfer_order=args.order,
+                          quiet=args.quiet,
+                          move_destination=move_destination,
+                          query_workers=args.parallel_finds,
+                          dry_run=args.dry_run)
         except ValueError as e:
             print(f"\n❌ Error: {e}")
             sys.exit(1)
@@ -1989,40 +3633,83 @@ Examples:
     # Normal continuous sync mode
     print("\n" + "=" * 80)
     print("Starting automatic synchronization")
-    print("Sync will run every 60 seconds (pauses only if <30 images transferred)")
+    print(f"Sync will run every {CYCLE_WAIT} seconds ({ACTIVE_CYCLE_WAIT} seconds after transfers, none after ≥30 images)")
     print("Press Ctrl+C to stop")
     print("=" * 80)
 
     cycle_count = 0
+    idle_cache = IdleStudyCache()
 
     try:
         while True:
             cycle_count += 1
-            print(f"\n\n{'#' * 100}")
-            print(f"{'#' * 100}")
-            print(f"CYCLE {cycle_count}")
-            print(f"{'#' * 100}")
-            print(f"{'#' * 100}")
+            if args.quiet:
+                print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] CYCLE {cycle_count}")
+            else:
+                print(f"\n\n{'#' * 100}")
+                print(f"{'#' * 100}")
+                print(f"CYCLE {cycle_count}")
+                print(f"{'#' * 100}")
+                print(f"{'#' * 100}")
+
+            # Pick up configuration changes (one stat() unless the file changed or SIGHUP was received)
+            force_reload = reload_requested
+            reload_requested = False
+            if config.load(auto_detect_local_ip=not args.no_auto_ip, force=force_reload):
+                reloaded_node = config.get_remote_node(args.node)
+                if reloaded_node is None:
+                    print(f"Warning: Remote node '{args.node}' no longer in configuration, keeping previous settings")
+                elif reloaded_node is not remote_node:
+                    remote_node = reloaded_node
+                    print(f"Configuration reloaded: {remote_node}")
+                move_destination = get_move_destination(config, remote_node)
 
             # Clean up old entries from stability tracker every 10 cycles
             if stability_tracker and cycle_count % 10 == 0:
                 stability_tracker.cleanup_old_entries()
 
-            transferred_images = run_sync_cycle(config, remote_node, client,
-                                               stability_tracker=stability_tracker,
-                                               max_images=args.max_images,
-                                               all_series=args.all_series, hours=args.hours,
-                                               download_day=None,
-                                               use_image_level=args.image_level)
-
-            # Save stability tracker state after each cycle
+            # The study query, series comparison and transfers of a cycle share associations
+            with client.persistent_associations():
+                transferred_images = run_sync_cycle(config, remote_node, client,
+                                                   stability_tracker=stability_tracker,
+                                                   max_images=args.max_images,
+                                                   all_series=args.all_series, hours=args.hours,
+                                                   download_day=None,
+                                                   use_image_level=args.image_level,
+                                                   transfer_workers=args.parallel_transfers,
+                                                   image_workers=args.parallel_images,
+                                                   idle_cache=idle_cache,
+                                                   transfer_order=args.order,
+                                                   quiet=args.quiet,
+                                                   inventory=inventory,
+                                                   move_destination=move_destination,
+                                                   query_workers=args.parallel_finds,
+                                                   dry_run=args.dry_run)
+
+            # Save stability tracker and inventory state after each cycle
             if stability_tracker:
                 stability_tracker.save()
+            if inventory:
+                inventory.save()
 
-            # Wait 60 seconds if fewer than 30 images were transferred
+            # Wait if fewer than 30 images were transferred; briefly while studies are still arriving
             if transferred_images < 30:
-                print(f"\nTransferred {transferred_images} images. Waiting 60 seconds before next sync cycle...")
-                time.sleep(60)
+                wait_seconds = ACTIVE_CYCLE_WAIT if transferred_images else CYCLE_WAIT
+                print(f"\nTransferred {transferred_images} images. Waiting {wait_seconds} seconds before next sync cycle...")
+                # Only files arriving during the wait should end it early; a SIGHUP received
+                # during the cycle skips the wait
+                wake_event.clear()
+                deadline = time.monotonic() + wait_seconds
+                files_received = False
+                while not reload_requested and not files_received:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    files_received = wake_event.wait(timeout=min(remaining, RELOAD_POLL_INTERVAL))
+                if reload_requested:
+                    print("Configuration reload requested (SIGHUP). Starting next cycle early...")
+                elif files_received:
+                    print("Incoming files received. Starting next cycle early...")
             else:
                 print(f"\nTransferred {transferred_images} images (≥30). Starting next cycle immediately...")
                 time.sleep(1)  # Short pause to prevent tight loop
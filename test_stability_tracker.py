@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Test script for the series stability tracker (runs standalone or with pytest)"""
+
+import os
+import tempfile
+
+from dicom_query_compare import SeriesStabilityTracker
+
+
+def make_tracker() -> SeriesStabilityTracker:
+    """Tracker backed by a fresh file in a temporary directory"""
+    return SeriesStabilityTracker(os.path.join(tempfile.mkdtemp(), "series_stability.json"))
+
+
+def test_new_series_is_pending():
+    tracker = make_tracker()
+    assert not tracker.update_series("ct", "1.2.3", "1.2.3.1", 10)
+    assert tracker.has_pending("ct")
+
+
+def test_stable_series_is_no_longer_pending():
+    tracker = make_tracker()
+    tracker.update_series("ct", "1.2.3", "1.2.3.1", 10)
+    assert tracker.update_series("ct", "1.2.3", "1.2.3.1", 10)
+    assert tracker.series_states[("ct", "1.2.3", "1.2.3.1")]["stable_since"] is not None
+    assert not tracker.has_pending("ct")
+
+
+def test_growing_series_is_pending_again():
+    tracker = make_tracker()
+    tracker.update_series("ct", "1.2.3", "1.2.3.1", 10)
+    tracker.update_series("ct", "1.2.3", "1.2.3.1", 10)
+    assert not tracker.update_series("ct", "1.2.3", "1.2.3.1", 12)
+    assert tracker.has_pending("ct")
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"✓ {name}")
+    print("\nAll tests completed!")
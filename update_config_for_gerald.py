@@ -3,29 +3,57 @@
 Quick script to update dicom_config.json with gerald node using ExplicitVRLittleEndian
 """
 
+import argparse
 import json
+import os
 import shutil
 from pathlib import Path
 
+try:
+    import orjson  # Optional: faster JSON (de)serialization
+except ImportError:
+    orjson = None
+
 CONFIG_FILE = "dicom_config.json"
+DEFAULT_TRANSFER_SYNTAX = "JPEG2000Lossless"  # Used for nodes without a transfer_syntax
+
+
+def load_json(raw: bytes):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dump_json(data) -> bytes:
+    """Serialize data as indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
 
 def main():
+    parser = argparse.ArgumentParser(description='Add transfer syntaxes and the gerald node to dicom_config.json')
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Print the full config before and after the update'
+    )
+    args = parser.parse_args()
+
     if not Path(CONFIG_FILE).exists():
         print(f"❌ Error: {CONFIG_FILE} not found!")
         return
 
-    # Create backup
-    backup_file = f"{CONFIG_FILE}.backup"
-    shutil.copy(CONFIG_FILE, backup_file)
-    print(f"✓ Backup created: {backup_file}\n")
+    # Load config (the raw bytes are kept for the backup)
+    raw = Path(CONFIG_FILE).read_bytes()
+    config = load_json(raw)
+    original = dump_json(config)
 
-    # Load config
-    with open(CONFIG_FILE, 'r') as f:
-        config = json.load(f)
-
-    print("Original config:")
-    print(json.dumps(config, indent=2))
-    print("\n" + "=" * 80 + "\n")
+    if args.verbose:
+        print("Original config:")
+        print(original.decode())
+        print("\n" + "=" * 80 + "\n")
 
     # Migrate to new format if needed
     if "remote" in config and "remotes" not in config:
@@ -34,8 +62,7 @@ def main():
         short_name = remote_node["name"].lower().replace(" ", "_")
 
         # Add transfer_syntax if not present
-        if "transfer_syntax" not in remote_node:
-            remote_node["transfer_syntax"] = "JPEG2000Lossless"
+        remote_node.setdefault("transfer_syntax", DEFAULT_TRANSFER_SYNTAX)
 
         config["remotes"] = {
             short_name: remote_node
@@ -44,19 +71,21 @@ def main():
         print(f"✓ Migrated. Node accessible as '{short_name}'\n")
 
     # Add transfer_syntax to local if not present
-    if "transfer_syntax" not in config["local"]:
-        config["local"]["transfer_syntax"] = "JPEG2000Lossless"
+    config["local"].setdefault("transfer_syntax", DEFAULT_TRANSFER_SYNTAX)
 
     # Add transfer_syntax to existing remotes if not present
-    for short_name, node in config["remotes"].items():
-        if "transfer_syntax" not in node:
-            node["transfer_syntax"] = "JPEG2000Lossless"
-            print(f"✓ Added JPEG2000Lossless to '{short_name}'")
+    remotes = config["remotes"]
+    added = [short_name for short_name, node in remotes.items()
+             if "transfer_syntax" not in node]
+    for short_name in added:
+        remotes[short_name]["transfer_syntax"] = DEFAULT_TRANSFER_SYNTAX
+    if added:
+        print("\n".join(f"✓ Added {DEFAULT_TRANSFER_SYNTAX} to '{short_name}'" for short_name in added))
 
     # Example: Add gerald node if not exists
-    if "gerald" not in config["remotes"]:
+    if "gerald" not in remotes:
         print("\nAdding 'gerald' node as example...")
-        config["remotes"]["gerald"] = {
+        remotes["gerald"] = {
             "name": "Gerald PACS",
             "ae_title": "GERALD",
             "ip_address": "10.1.15.40",  # Change this to actual IP
@@ -66,20 +95,36 @@ def main():
         print("✓ 'gerald' node added with ExplicitVRLittleEndian")
         print("⚠ Please update IP address and port in the config file!")
 
-    # Save updated config
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=2)
-
+    updated = dump_json(config)
     print("\n" + "=" * 80)
-    print("\n✓ Configuration updated!\n")
-    print("Updated config:")
-    print(json.dumps(config, indent=2))
+    if updated == original:
+        # Already migrated: leave the file and the previous backup alone
+        print("\n✓ Configuration already up to date, nothing written")
+    else:
+        # Create backup, then save updated config
+        backup_file = f"{CONFIG_FILE}.backup"
+        Path(backup_file).write_bytes(raw)
+        shutil.copymode(CONFIG_FILE, backup_file)
+        print(f"\n✓ Backup created: {backup_file}")
+        tmp_file = f"{CONFIG_FILE}.tmp"
+        with open(tmp_file, 'wb') as f:
+            shutil.copymode(CONFIG_FILE, tmp_file)  # Keep the permissions of the original file
+            f.write(updated)
+            # On disk before the rename, so a crash cannot leave an empty config behind
+            f.flush()
+            os.fsync(f.fileno())
+        # Atomic on POSIX: an interrupted run never leaves a truncated config behind
+        os.replace(tmp_file, CONFIG_FILE)
+
+        print(f"\n✓ Configuration updated: {CONFIG_FILE}")
+        if args.verbose:
+            print("\nUpdated config:")
+            print(updated.decode())
 
     print("\n" + "=" * 80)
     print("\nUsage:")
-    for short_name in config["remotes"].keys():
-        node = config["remotes"][short_name]
-        syntax = node.get("transfer_syntax", "JPEG2000Lossless")
+    for short_name, node in remotes.items():
+        syntax = node.get("transfer_syntax", DEFAULT_TRANSFER_SYNTAX)
         print(f"  python3 dicom_query_compare.py --node {short_name}  # {syntax}")
 
 if __name__ == "__main__":